@@ -8,7 +8,7 @@ from urllib.parse import urlsplit
 import httpx
 from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, ValidationError, field_validator
 
-from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound, pin_hostname_resolution
+from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound_async, pin_hostname_resolution
 
 _AGENT_JSON_PATH = "/.well-known/agent.json"
 _DID_DOCUMENT_PATH = "/.well-known/did.json"
@@ -78,7 +78,7 @@ async def _fetch_json_document(
     allow_private_network_targets: bool,
 ) -> dict[str, Any] | None:
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             url,
             allow_private=allow_private_network_targets,
         )
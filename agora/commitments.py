@@ -13,7 +13,7 @@ import httpx
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
-from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound, pin_hostname_resolution
+from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound_async, pin_hostname_resolution
 
 
 def _did_web_document_url(did: str) -> str:
@@ -142,7 +142,7 @@ async def _fetch_json_document(
     allow_private_network_targets: bool,
 ) -> dict[str, Any] | None:
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             url,
             allow_private=allow_private_network_targets,
         )
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     allow_private_network_targets: bool = False
     allow_unresolvable_registration_hostnames: bool = False
     metrics_max_entries: int = 2048
+    argon2_time_cost: int = 2
     rate_limit_backend: str = "auto"
     redis_url: str | None = None
     rate_limit_prefix: str = "agora:rate_limit"
@@ -8,7 +8,7 @@ from urllib.parse import urlsplit
 
 import httpx
 
-from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound, pin_hostname_resolution
+from agora.url_safety import URLSafetyError, assert_url_safe_for_outbound_async, pin_hostname_resolution
 
 ERC8004_REGISTRATION_TYPE = "https://eips.ethereum.org/EIPS/eip-8004#registration-v1"
 ERC8004_REGISTRATION_PATH = "/.well-known/agent-registration.json"
@@ -86,7 +86,7 @@ async def discover_erc8004_registration_econ_id(
     registration_url = build_registration_url(endpoint_url)
 
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             registration_url,
             allow_private=allow_private_network_targets,
         )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+import logging
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlsplit
 from uuid import UUID
 
 import httpx
@@ -16,12 +17,20 @@ from agora.commitments import verify_commitments_document
 from agora.erc8004 import discover_erc8004_registration_econ_id, resolve_erc8004_verification
 from agora.models import Agent
 from agora.query_tracker import QueryTracker
+from agora.url_normalization import split_url
 from agora.url_safety import (
     URLSafetyError,
-    assert_url_safe_for_outbound,
+    assert_url_safe_for_outbound_async,
+    invalidate_outbound_target,
     pin_hostname_resolution,
 )
-from agora.validation import AgentCardValidationError, validate_agent_card
+from agora.validation import AgentCardValidationError, validate_agent_card_json
+
+
+health_logger = logging.getLogger("agora.health")
+
+# Agents are probed concurrently; each check fetches several documents sequentially.
+HEALTH_CHECK_CONCURRENCY = 32
 
 
 @dataclass(slots=True)
@@ -50,7 +59,8 @@ def build_agent_card_probe_urls(agent_url: str) -> list[str]:
     3. Root `/` on the agent origin
     """
 
-    parts = urlsplit(agent_url)
+    # Agent URLs repeat every cycle; `split_url` memoizes the parse.
+    parts = split_url(agent_url)
     host = parts.hostname or ""
     scheme = parts.scheme or "https"
     port = parts.port
@@ -62,18 +72,16 @@ def build_agent_card_probe_urls(agent_url: str) -> list[str]:
     normalized_path = parts.path or "/"
     normalized_agent_url = f"{origin}{normalized_path}"
 
-    candidates = [
-        f"{origin}/.well-known/agent-card.json",
-        normalized_agent_url,
-        f"{origin}/",
-    ]
-
     # Preserve order while removing duplicates (for example when agent.url is "/").
-    deduped: list[str] = []
-    for candidate in candidates:
-        if candidate not in deduped:
-            deduped.append(candidate)
-    return deduped
+    return list(
+        dict.fromkeys(
+            (
+                f"{origin}/.well-known/agent-card.json",
+                normalized_agent_url,
+                f"{origin}/",
+            )
+        )
+    )
 
 
 async def _check_single_agent(
@@ -97,18 +105,21 @@ async def _check_single_agent(
 
     for probe_url in probe_urls:
         try:
-            safe_target = assert_url_safe_for_outbound(
+            safe_target = await assert_url_safe_for_outbound_async(
                 probe_url,
                 allow_private=allow_private_network_targets,
             )
             async with pin_hostname_resolution(safe_target.hostname, safe_target.pinned_ip):
                 response = await client.get(probe_url, follow_redirects=False)
             response.raise_for_status()
-            payload = response.json()
-            validated_card = validate_agent_card(payload)
+            validated_card = validate_agent_card_json(response.content)
             discovered_protocol_version = validated_card.card.protocol_version
             is_healthy = True
             break
+        except httpx.TransportError:
+            # The pinned address may have gone stale; re-resolve on the next attempt.
+            invalidate_outbound_target(probe_url)
+            continue
         except (httpx.HTTPError, ValueError, AgentCardValidationError, URLSafetyError):
             continue
 
@@ -160,6 +171,7 @@ async def run_health_check_cycle(
     *,
     timeout_seconds: int = 10,
     allow_private_network_targets: bool = False,
+    concurrency: int = HEALTH_CHECK_CONCURRENCY,
 ) -> HealthCheckSummary:
     """Run one selective health-check cycle over recently queried agents."""
 
@@ -175,19 +187,30 @@ async def run_health_check_cycle(
         if not agents:
             return summary
 
+        semaphore = asyncio.Semaphore(concurrency)
         async with httpx.AsyncClient(timeout=timeout) as client:
-            for agent in agents:
-                summary.checked_count += 1
-                healthy = await _check_single_agent(
-                    agent,
-                    client,
-                    now_utc,
-                    allow_private_network_targets=allow_private_network_targets,
-                )
-                if healthy:
-                    summary.healthy_count += 1
-                else:
-                    summary.unhealthy_count += 1
+
+            async def _check(agent: Agent) -> bool:
+                # Checks only mutate their own ORM instance; the session is untouched
+                # until the commit below, so they can share it while running concurrently.
+                async with semaphore:
+                    try:
+                        return await _check_single_agent(
+                            agent,
+                            client,
+                            now_utc,
+                            allow_private_network_targets=allow_private_network_targets,
+                        )
+                    except Exception:
+                        # Contain the failure so sibling checks finish and the cycle commits.
+                        health_logger.exception("health_check_agent_failed agent_id=%s", agent.id)
+                        return False
+
+            results = await asyncio.gather(*(_check(agent) for agent in agents))
+
+        summary.checked_count += len(results)
+        summary.healthy_count += sum(results)
+        summary.unhealthy_count += len(results) - sum(results)
 
         missing_count = len(candidate_ids) - len(agents)
         if missing_count > 0:
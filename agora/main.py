@@ -9,6 +9,7 @@ import math
 import re
 from datetime import date, datetime, timedelta, timezone
 from email.utils import format_datetime
+from functools import lru_cache
 from pathlib import Path
 from secrets import token_urlsafe
 from textwrap import dedent
@@ -57,11 +58,15 @@ from agora.security import (
     should_rehash_api_key_hash,
     verify_api_key,
 )
-from agora.stale import compute_agent_stale_metadata, stale_filter_expression
+from agora.stale import (
+    compute_agent_stale_metadata,
+    compute_agent_stale_metadata_bulk,
+    stale_filter_expression,
+)
 from agora.url_normalization import URLNormalizationError, normalize_url
 from agora.url_safety import (
     URLSafetyError,
-    assert_url_safe_for_outbound,
+    assert_url_safe_for_outbound_async,
     assert_url_safe_for_registration,
     pin_hostname_resolution,
 )
@@ -104,6 +109,7 @@ health_task: asyncio.Task[None] | None = None
 registry_task: asyncio.Task[None] | None = None
 reputation_task: asyncio.Task[None] | None = None
 latest_registry_snapshot: dict[str, Any] | None = None
+registry_snapshot_build: asyncio.Task[dict[str, Any]] | None = None
 request_metrics = BoundedRequestMetrics(max_entries=settings.metrics_max_entries)
 last_health_summary: dict[str, int] = {
     "checked_count": 0,
@@ -445,9 +451,71 @@ async def _authenticate_agent_from_api_key(
     return None
 
 
-async def _refresh_reliability_scores_view(session: AsyncSession) -> None:
+_RELIABILITY_SCORES_REFRESH_SQL = """
+    WITH fresh AS (
+        SELECT
+            agent_id,
+            COUNT(*)::int AS sample_size,
+            AVG(CASE WHEN response_received THEN 100.0 ELSE 0.0 END) AS uptime_pct,
+            AVG(CASE WHEN response_valid THEN 100.0 ELSE 0.0 END) AS response_valid_pct,
+            AVG(CASE WHEN terms_honored THEN 100.0 ELSE 0.0 END) AS terms_honored_pct,
+            AVG(response_time_ms)::float AS avg_latency_ms,
+            (
+                COALESCE(AVG(CASE WHEN response_received THEN 100.0 ELSE 0.0 END), 0)
+                + COALESCE(AVG(CASE WHEN response_valid THEN 100.0 ELSE 0.0 END), 0)
+                + COALESCE(AVG(CASE WHEN terms_honored THEN 100.0 ELSE 0.0 END), 0)
+            ) / 3.0 AS availability_score,
+            MAX(created_at) AS last_report_at
+        FROM reliability_reports
+        WHERE created_at > NOW() - INTERVAL '30 days'
+          AND retracted_at IS NULL
+          AND (held_until IS NULL OR held_until <= NOW())
+          {scope}
+        GROUP BY agent_id
+    ),
+    upserted AS (
+        INSERT INTO agent_reliability_scores (
+            agent_id,
+            sample_size,
+            uptime_pct,
+            response_valid_pct,
+            terms_honored_pct,
+            avg_latency_ms,
+            availability_score,
+            last_report_at
+        )
+        SELECT * FROM fresh
+        ON CONFLICT (agent_id) DO UPDATE SET
+            sample_size = EXCLUDED.sample_size,
+            uptime_pct = EXCLUDED.uptime_pct,
+            response_valid_pct = EXCLUDED.response_valid_pct,
+            terms_honored_pct = EXCLUDED.terms_honored_pct,
+            avg_latency_ms = EXCLUDED.avg_latency_ms,
+            availability_score = EXCLUDED.availability_score,
+            last_report_at = EXCLUDED.last_report_at
+    )
+    DELETE FROM agent_reliability_scores
+    WHERE agent_id NOT IN (SELECT agent_id FROM fresh)
+      {scope}
+"""
+
+
+async def _refresh_reliability_scores(session: AsyncSession, *, agent_id: UUID | None = None) -> None:
+    """
+    Upsert rows of the `agent_reliability_scores` rollup table.
+
+    With `agent_id`, only that agent's reports are re-aggregated, so report writes no
+    longer rescan the whole window. The periodic refresh passes no agent to roll the
+    30-day window forward and pick up released holds.
+    """
+
+    if agent_id is None:
+        statement, params = _RELIABILITY_SCORES_REFRESH_SQL.format(scope=""), {}
+    else:
+        statement = _RELIABILITY_SCORES_REFRESH_SQL.format(scope="AND agent_id = :agent_id")
+        params = {"agent_id": agent_id}
     try:
-        await session.execute(sa_text("REFRESH MATERIALIZED VIEW agent_reliability_scores"))
+        await session.execute(sa_text(statement), params)
         await session.commit()
     except ProgrammingError:
         await session.rollback()
@@ -803,15 +871,30 @@ async def _health_checker_loop() -> None:
         await asyncio.sleep(settings.health_check_interval)
 
 
+async def _refresh_registry_snapshot() -> dict[str, Any]:
+    """
+    Rebuild the registry snapshot, coalescing concurrent callers into one build.
+
+    Callers that arrive while a build is in flight await the same task instead of
+    starting another full table scan.
+    """
+
+    global latest_registry_snapshot, registry_snapshot_build
+    if registry_snapshot_build is None or registry_snapshot_build.done():
+        registry_snapshot_build = asyncio.create_task(build_registry_snapshot(AsyncSessionLocal))
+    snapshot = await asyncio.shield(registry_snapshot_build)
+    latest_registry_snapshot = snapshot
+    return snapshot
+
+
 async def _registry_refresh_loop() -> None:
-    global latest_registry_snapshot
     while True:
         try:
-            latest_registry_snapshot = await build_registry_snapshot(AsyncSessionLocal)
+            snapshot = await _refresh_registry_snapshot()
             registry_logger.info(
                 "registry_snapshot_refreshed agents_count=%s generated_at=%s",
-                latest_registry_snapshot["agents_count"],
-                latest_registry_snapshot["generated_at"],
+                snapshot["agents_count"],
+                snapshot["generated_at"],
             )
         except Exception as exc:  # pragma: no cover - defensive background safety
             registry_logger.exception("registry_snapshot_failed error=%s", exc)
@@ -826,7 +909,7 @@ async def _reputation_refresh_loop() -> None:
             async with AsyncSessionLocal() as session:
                 await _release_held_reports(session, now_utc=now_utc)
                 await _flag_reputation_anomalies(session, now_utc=now_utc)
-                await _refresh_reliability_scores_view(session)
+                await _refresh_reliability_scores(session)
                 reputation_logger.info("reputation_scores_and_flags_refreshed")
         except Exception as exc:  # pragma: no cover - defensive background safety
             reputation_logger.exception("reputation_refresh_failed error=%s", exc)
@@ -1063,8 +1146,8 @@ async def home_page(
 
     now_utc = datetime.now(tz=timezone.utc)
     cards = []
-    for agent in recent_agents:
-        is_stale, stale_days = compute_agent_stale_metadata(agent, now=now_utc)
+    stale_metadata = compute_agent_stale_metadata_bulk(recent_agents, now=now_utc)
+    for agent, (is_stale, stale_days) in zip(recent_agents, stale_metadata):
         summary = reputation_summaries.get(agent.id, {})
         cards.append(
             {
@@ -1615,7 +1698,7 @@ def _extract_tokens_from_operator_well_known_payload(payload: Any) -> list[str]:
 
 async def _fetch_operator_verification_tokens_from_well_known(operator_url: str) -> list[str]:
     endpoint_url = _operator_well_known_url(operator_url)
-    safe_target = assert_url_safe_for_outbound(
+    safe_target = await assert_url_safe_for_outbound_async(
         endpoint_url,
         allow_private=settings.allow_private_network_targets,
     )
@@ -1887,7 +1970,7 @@ async def _run_preflight_health_check(normalized_url: str) -> dict[str, str | No
     async with httpx.AsyncClient(timeout=timeout) as client:
         for probe_url in probe_urls:
             try:
-                safe_target = assert_url_safe_for_outbound(
+                safe_target = await assert_url_safe_for_outbound_async(
                     probe_url,
                     allow_private=settings.allow_private_network_targets,
                 )
@@ -1949,7 +2032,7 @@ async def _run_preflight_did_check(did: str | None) -> dict[str, str | None]:
         return _preflight_check_result(status_value="fail", detail=str(exc))
 
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             did_document_url,
             allow_private=settings.allow_private_network_targets,
         )
@@ -1984,7 +2067,7 @@ async def _run_preflight_did_check(did: str | None) -> dict[str, str | None]:
 async def _fetch_preflight_json_document(url: str, *, field_name: str) -> tuple[dict[str, Any] | None, str | None]:
     timeout = httpx.Timeout(PREFLIGHT_CHECK_TIMEOUT_SECONDS)
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             url,
             allow_private=settings.allow_private_network_targets,
         )
@@ -2298,7 +2381,7 @@ def _resolve_agent_card_well_known_url(agent_card_url: str) -> str:
 async def _fetch_agent_card_from_url(agent_card_url: str) -> dict[str, Any]:
     try:
         resolved = _resolve_agent_card_well_known_url(agent_card_url)
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             resolved,
             allow_private=settings.allow_private_network_targets,
         )
@@ -2917,7 +3000,8 @@ async def register_agent(
 ) -> dict[str, str]:
     await _enforce_registration_rate_limits(request, api_key)
 
-    sanitized_payload = sanitize_json_strings(payload)
+    # Copy the top level: the sanitizer may return `payload` itself and keys are popped below.
+    sanitized_payload = dict(sanitize_json_strings(payload))
     try:
         registration_request = RegisterAgentRequest.model_validate(sanitized_payload)
     except Exception as exc:
@@ -3194,7 +3278,7 @@ async def complete_recovery(
 
     verify_url = _build_verify_url(agent.url)
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             verify_url,
             allow_private=settings.allow_private_network_targets,
         )
@@ -3463,7 +3547,7 @@ async def verify_did(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     try:
-        safe_target = assert_url_safe_for_outbound(
+        safe_target = await assert_url_safe_for_outbound_async(
             did_document_url,
             allow_private=settings.allow_private_network_targets,
         )
@@ -3740,7 +3824,7 @@ async def submit_reliability_report(
 
     await session.refresh(report)
     try:
-        await _refresh_reliability_scores_view(session)
+        await _refresh_reliability_scores(session, agent_id=agent_id)
     except DBAPIError as exc:  # pragma: no cover - best effort refresh
         reputation_logger.warning("reliability_refresh_after_submit_failed error=%s", exc)
 
@@ -3783,7 +3867,7 @@ async def retract_reliability_report(
         await session.commit()
         await session.refresh(report)
         try:
-            await _refresh_reliability_scores_view(session)
+            await _refresh_reliability_scores(session, agent_id=agent_id)
         except DBAPIError as exc:  # pragma: no cover - best effort refresh
             reputation_logger.warning("reliability_refresh_after_retract_failed error=%s", exc)
 
@@ -4066,7 +4150,8 @@ async def update_agent(
     previous_operator_identity = _operator_claim_identity(agent.operator)
     previous_operator_verified = _operator_claim_is_verified(agent.operator)
 
-    sanitized_payload = sanitize_json_strings(agent_card_payload)
+    # Copy the top level: the sanitizer may return the request body itself.
+    sanitized_payload = dict(sanitize_json_strings(agent_card_payload))
     econ_id = _normalize_optional_string_field(
         field_name="econ_id",
         value=sanitized_payload.get("econ_id"),
@@ -4429,8 +4514,8 @@ async def list_agents(
     )
 
     response_agents: list[dict[str, Any]] = []
-    for agent in agents:
-        is_stale, stale_days = compute_agent_stale_metadata(agent, now=now_utc)
+    stale_metadata = compute_agent_stale_metadata_bulk(agents, now=now_utc)
+    for agent, (is_stale, stale_days) in zip(agents, stale_metadata):
         summary = reputation_summaries.get(agent.id, {})
         response_agents.append(
             {
@@ -4588,8 +4673,8 @@ async def stale_candidates_report(
         ).all()
     )
     candidates = []
-    for agent in agents:
-        is_stale, stale_days = compute_agent_stale_metadata(agent, now=now_utc)
+    stale_metadata = compute_agent_stale_metadata_bulk(agents, now=now_utc)
+    for agent, (is_stale, stale_days) in zip(agents, stale_metadata):
         candidates.append(
             {
                 "id": str(agent.id),
@@ -4636,29 +4721,33 @@ async def delete_agent(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@lru_cache(maxsize=1)
+def _registry_cache_headers(generated_at: str, agents_count: int) -> dict[str, str]:
+    """Build registry.json cache headers once per snapshot instead of once per request."""
+
+    return {
+        "Cache-Control": "public, max-age=300, stale-while-revalidate=120",
+        "ETag": f"\"{generated_at}:{agents_count}\"",
+        "Last-Modified": format_datetime(datetime.fromisoformat(generated_at), usegmt=True),
+    }
+
+
 @app.get("/api/v1/registry.json", tags=["registry"])
 async def registry_export(request: Request) -> JSONResponse:
-    global latest_registry_snapshot
     await _enforce_rate_limit(
         key=f"api:get_registry:ip:{_client_ip(request)}",
         limit=10,
     )
 
-    if latest_registry_snapshot is None:
-        latest_registry_snapshot = await build_registry_snapshot(AsyncSessionLocal)
-
-    generated_at = latest_registry_snapshot.get("generated_at", "")
-    agents_count = latest_registry_snapshot.get("agents_count", 0)
-    generated_dt = datetime.fromisoformat(generated_at) if generated_at else datetime.now(tz=timezone.utc)
-    etag = f"\"{generated_at}:{agents_count}\""
+    snapshot = latest_registry_snapshot
+    if snapshot is None:
+        snapshot = await _refresh_registry_snapshot()
 
+    generated_at = snapshot.get("generated_at") or datetime.now(tz=timezone.utc).isoformat()
+    agents_count = snapshot.get("agents_count", 0)
     return JSONResponse(
-        content=latest_registry_snapshot,
-        headers={
-            "Cache-Control": "public, max-age=300, stale-while-revalidate=120",
-            "ETag": etag,
-            "Last-Modified": format_datetime(generated_dt, usegmt=True),
-        },
+        content=snapshot,
+        headers=_registry_cache_headers(generated_at, agents_count),
     )
 
 
@@ -4693,24 +4782,29 @@ async def database_health_check(
     }
 
 
+def _uptime_seconds() -> int:
+    return int(monotonic() - started_at_monotonic)
+
+
 @app.get("/api/v1/health", tags=["health"])
 async def basic_health(
     session: AsyncSession = Depends(get_db_session),
 ) -> dict[str, int | str]:
     try:
-        await run_health_query(session)
-        agents_count = int((await session.scalar(select(func.count(Agent.id)))) or 0)
+        # The count doubles as the connectivity probe; COUNT(*) lets Postgres use the
+        # primary-key index instead of checking each id for NULL.
+        agents_count = int((await session.scalar(select(func.count()).select_from(Agent))) or 0)
     except Exception:
         return {
             "status": "unhealthy",
             "version": settings.app_version,
             "agents_count": 0,
-            "uptime_seconds": int(monotonic() - started_at_monotonic),
+            "uptime_seconds": _uptime_seconds(),
         }
 
     return {
         "status": "healthy",
         "version": settings.app_version,
         "agents_count": agents_count,
-        "uptime_seconds": int(monotonic() - started_at_monotonic),
+        "uptime_seconds": _uptime_seconds(),
     }
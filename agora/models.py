@@ -9,6 +9,7 @@ from uuid import UUID
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -68,6 +69,11 @@ class Agent(Base):
         Index("idx_agents_agent_json_verified", "agent_json_verified"),
         Index("idx_agents_protocol_version", "protocol_version"),
         Index("idx_agents_oatr_issuer_id", "oatr_issuer_id"),
+        Index(
+            "idx_agents_stale_since",
+            "stale_since",
+            postgresql_where=text("health_status = 'unhealthy'"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -153,6 +159,12 @@ class Agent(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    # Reference timestamp for stale checks, maintained by Postgres.
+    stale_since: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        Computed("coalesce(last_healthy_at, registered_at)", persisted=True),
+        nullable=True,
+    )
     recovery_challenge_hash: Mapped[str | None] = mapped_column(
         String(255),
         nullable=True,
@@ -198,6 +210,7 @@ class AgentReliabilityReport(Base):
         ),
         Index("idx_reliability_agent_created", "agent_id", "created_at"),
         Index("idx_reliability_reporter_agent", "reporter_agent_id", "agent_id"),
+        Index("idx_reliability_created_brin", "created_at", postgresql_using="brin"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -265,9 +278,6 @@ class AgentIncident(Base):
         ),
         Index("idx_incidents_agent_created", "agent_id", "created_at"),
         Index("idx_incidents_reporter_agent", "reporter_agent_id", "agent_id"),
-        Index("idx_incidents_category", "category"),
-        Index("idx_incidents_outcome", "outcome"),
-        Index("idx_incidents_visibility", "visibility"),
     )
 
     id: Mapped[UUID] = mapped_column(
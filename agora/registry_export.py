@@ -9,7 +9,26 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from agora.models import Agent
-from agora.stale import compute_agent_stale_metadata
+from agora.stale import compute_stale_metadata_bulk
+
+_SNAPSHOT_COLUMNS = (
+    Agent.id,
+    Agent.agent_card,
+    Agent.health_status,
+    Agent.last_health_check,
+    Agent.last_healthy_at,
+    Agent.registered_at,
+    Agent.updated_at,
+    Agent.protocol_version,
+    Agent.econ_id,
+    Agent.oatr_issuer_id,
+    Agent.erc8004_verified,
+    Agent.agent_json_verified,
+    Agent.commitments_count,
+    Agent.commitments_summary,
+    Agent.operator,
+    Agent.availability,
+)
 
 
 async def build_registry_snapshot(
@@ -18,12 +37,19 @@ async def build_registry_snapshot(
     """Build a full registry export snapshot from current DB state."""
 
     generated_at = datetime.now(tz=timezone.utc)
+    # Select only exported columns as plain rows; skipping ORM entity hydration and the
+    # unused search/ownership columns keeps full-registry scans cheap.
     async with session_factory() as session:
-        agents = list((await session.scalars(select(Agent).order_by(Agent.registered_at.desc()))).all())
+        agents = (
+            await session.execute(select(*_SNAPSHOT_COLUMNS).order_by(Agent.registered_at.desc()))
+        ).all()
 
+    stale_metadata = compute_stale_metadata_bulk(
+        ((agent.health_status, agent.last_healthy_at, agent.registered_at) for agent in agents),
+        now=generated_at,
+    )
     rows: list[dict[str, Any]] = []
-    for agent in agents:
-        is_stale, stale_days = compute_agent_stale_metadata(agent, now=generated_at)
+    for agent, (is_stale, stale_days) in zip(agents, stale_metadata):
         rows.append(
             {
                 "id": str(agent.id),
@@ -3,19 +3,17 @@
 from __future__ import annotations
 
 
+# Control characters (other than common whitespace) mapped to None for str.translate.
+_CONTROL_CHAR_TABLE = {codepoint: None for codepoint in range(32) if chr(codepoint) not in "\n\r\t"}
+
+
 def sanitize_ui_text(value: str | None, *, max_length: int = 5000) -> str:
     """Strip unsafe control characters and cap length for rendered text."""
 
     if value is None:
         return ""
 
-    trimmed = value[:max_length]
-    safe_chars = []
-    for char in trimmed:
-        codepoint = ord(char)
-        if char in {"\n", "\r", "\t"} or codepoint >= 32:
-            safe_chars.append(char)
-    return "".join(safe_chars)
+    return value[:max_length].translate(_CONTROL_CHAR_TABLE)
 
 
 def sanitize_storage_text(value: str, *, max_length: int = 10000) -> str:
@@ -25,12 +23,25 @@ def sanitize_storage_text(value: str, *, max_length: int = 10000) -> str:
 
 
 def sanitize_json_strings(value: object) -> object:
-    """Recursively sanitize all strings inside JSON-like payloads."""
+    """
+    Recursively sanitize all strings inside JSON-like payloads.
+
+    Containers whose contents are already clean are returned as-is rather than
+    rebuilt, so the common no-op case allocates no new lists or dicts. The result may
+    therefore be the input object; callers that mutate it must copy first.
+    """
 
     if isinstance(value, str):
-        return sanitize_storage_text(value)
+        cleaned = sanitize_storage_text(value)
+        return value if cleaned == value else cleaned
     if isinstance(value, list):
-        return [sanitize_json_strings(item) for item in value]
+        cleaned_items = [sanitize_json_strings(item) for item in value]
+        if all(new is old for new, old in zip(cleaned_items, value)):
+            return value
+        return cleaned_items
     if isinstance(value, dict):
-        return {key: sanitize_json_strings(item) for key, item in value.items()}
+        cleaned_mapping = {key: sanitize_json_strings(item) for key, item in value.items()}
+        if all(cleaned_mapping[key] is item for key, item in value.items()):
+            return value
+        return cleaned_mapping
     return value
@@ -3,62 +3,132 @@
 from __future__ import annotations
 
 import hmac
-import re
 from hashlib import sha256
+from time import perf_counter
 
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
 
-_LEGACY_SHA256_RE = re.compile(r"^[a-f0-9]{64}$")
-_API_KEY_HASHER = PasswordHasher(
-    time_cost=3,
-    memory_cost=65536,
-    parallelism=4,
+from agora.config import get_settings
+from agora.ttl_cache import TTLCache
+
+_LEGACY_SHA256_HEX_CHARS = frozenset("0123456789abcdef")
+_ARGON2ID_HASH_PREFIX = "$argon2id$"
+# Encoded Argon2id hashes are ~100 chars; key hash columns are String(255).
+_MAX_ARGON2ID_HASH_LENGTH = 255
+# OWASP Argon2id profile (46 MiB, t=2, p=1). API keys are high-entropy server-generated
+# secrets, so heavier settings buy little extra offline-attack cost per verify.
+# `ARGON2_TIME_COST` overrides t per deployment (see `benchmark_argon2`); existing
+# hashes are upgraded on their next successful verify.
+ARGON2_MEMORY_COST = 47104
+ARGON2_PARALLELISM = 1
+_API_KEY_HASHER: PasswordHasher | None = None
+VERIFIED_KEY_CACHE_MAX_ENTRIES = 10_000
+VERIFIED_KEY_CACHE_TTL_SECONDS = 300
+
+
+# (provided key fingerprint, stored hash) pairs that recently passed Argon2 verification.
+# Keying on the stored hash means rotating or clearing it naturally misses the cache.
+_verified_key_cache: TTLCache[tuple[str, str], bool] = TTLCache(
+    max_entries=VERIFIED_KEY_CACHE_MAX_ENTRIES,
+    ttl_seconds=VERIFIED_KEY_CACHE_TTL_SECONDS,
 )
 
 
+def argon2_params() -> dict[str, int]:
+    """Return the configured Argon2id parameters for API key hashes."""
+
+    return {
+        "time_cost": get_settings().argon2_time_cost,
+        "memory_cost": ARGON2_MEMORY_COST,
+        "parallelism": ARGON2_PARALLELISM,
+    }
+
+
+def _api_key_hasher() -> PasswordHasher:
+    # Built on first use rather than at import, so settings overrides made before the
+    # first hash or verify still apply.
+    global _API_KEY_HASHER
+    if _API_KEY_HASHER is None:
+        _API_KEY_HASHER = PasswordHasher(**argon2_params())
+    return _API_KEY_HASHER
+
+
 def hash_api_key(api_key: str) -> str:
     """Return an Argon2id hash for an API key."""
 
-    return _API_KEY_HASHER.hash(api_key)
+    return _api_key_hasher().hash(api_key)
 
 
-def _hash_api_key_legacy(api_key: str) -> str:
-    return sha256(api_key.encode("utf-8")).hexdigest()
+def _hash_api_key_legacy_digest(api_key: str) -> bytes:
+    return sha256(api_key.encode("utf-8")).digest()
 
 
 def api_key_fingerprint(api_key: str) -> str:
-    """Return deterministic fingerprint for rate-limit bucketing/log correlation."""
+    """
+    Return a deterministic SHA-256 fingerprint of an API key or session secret.
+
+    Used for rate-limit bucketing and log correlation, but also as an authentication
+    input: it keys the verified-key cache and stores recovery session secrets.
+    """
+
+    return sha256(api_key.encode("utf-8")).hexdigest()
 
-    return _hash_api_key_legacy(api_key)
+
+def invalidate_api_key_cache(fingerprint: str | None = None) -> None:
+    """
+    Drop cached verifications for one key fingerprint, or for all keys when omitted.
+
+    Cached entries only live in process memory and expire after
+    `VERIFIED_KEY_CACHE_TTL_SECONDS`.
+    """
+
+    if fingerprint is None:
+        _verified_key_cache.clear()
+    else:
+        _verified_key_cache.pop_where(lambda key: key[0] == fingerprint)
 
 
 def is_legacy_api_key_hash(stored_hash: str | None) -> bool:
     """Return True when the stored hash uses legacy unsalted SHA-256."""
 
-    if stored_hash is None:
+    if stored_hash is None or len(stored_hash) != 64 or stored_hash.startswith("$argon2"):
         return False
-    return bool(_LEGACY_SHA256_RE.fullmatch(stored_hash))
+    return _LEGACY_SHA256_HEX_CHARS.issuperset(stored_hash)
 
 
 def verify_api_key(provided_api_key: str, stored_hash: str | None) -> bool:
     """
     Verify API key against a stored hash using constant-time comparison.
 
-    A missing stored hash is treated as a failed verification.
+    A missing stored hash is treated as a failed verification. Successful Argon2
+    verifications are cached briefly so repeat requests with the same key skip the KDF.
     """
 
     if stored_hash is None:
         return False
 
     if is_legacy_api_key_hash(stored_hash):
-        provided_hash = _hash_api_key_legacy(provided_api_key)
-        return hmac.compare_digest(provided_hash, stored_hash)
+        provided_digest = _hash_api_key_legacy_digest(provided_api_key)
+        return hmac.compare_digest(provided_digest, bytes.fromhex(stored_hash))
+
+    # Anything that is neither legacy SHA-256 nor a plausible Argon2id encoding can never
+    # verify, so reject it without paying for an Argon2 parse and exception.
+    if len(stored_hash) > _MAX_ARGON2ID_HASH_LENGTH or not stored_hash.startswith(_ARGON2ID_HASH_PREFIX):
+        return False
+
+    fingerprint = api_key_fingerprint(provided_api_key)
+    cache_key = (fingerprint, stored_hash)
+    if _verified_key_cache.get(cache_key):
+        return True
 
     try:
-        return _API_KEY_HASHER.verify(stored_hash, provided_api_key)
+        verified = _api_key_hasher().verify(stored_hash, provided_api_key)
     except (InvalidHashError, VerifyMismatchError):
         return False
+    if verified:
+        _verified_key_cache.set(cache_key, True)
+    return verified
 
 
 def should_rehash_api_key_hash(stored_hash: str | None) -> bool:
@@ -74,6 +144,48 @@ def should_rehash_api_key_hash(stored_hash: str | None) -> bool:
     if is_legacy_api_key_hash(stored_hash):
         return True
     try:
-        return _API_KEY_HASHER.check_needs_rehash(stored_hash)
+        return _api_key_hasher().check_needs_rehash(stored_hash)
     except InvalidHashError:
         return False
+
+
+def benchmark_argon2(
+    *,
+    memory_cost: int | None = None,
+    parallelism: int | None = None,
+    target_min_ms: float = 150.0,
+    max_time_cost: int = 16,
+) -> int:
+    """
+    Return the smallest Argon2 `time_cost` whose verify latency reaches `target_min_ms`.
+
+    Memory and parallelism stay fixed while `time_cost` is binary-searched on the current
+    host, so operators can pick bounded parameters for their hardware (150-250 ms per
+    verify is a reasonable window). Memory and parallelism default to `argon2_params()`.
+    Returns `max_time_cost` if the target is never reached.
+    """
+
+    params = argon2_params()
+    memory_cost = params["memory_cost"] if memory_cost is None else memory_cost
+    parallelism = params["parallelism"] if parallelism is None else parallelism
+    sample_key = "argon2-benchmark-key"
+
+    def _verify_latency_ms(time_cost: int) -> float:
+        hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+        )
+        encoded = hasher.hash(sample_key)
+        started = perf_counter()
+        hasher.verify(encoded, sample_key)
+        return (perf_counter() - started) * 1000
+
+    low, high = 1, max_time_cost
+    while low < high:
+        middle = (low + high) // 2
+        if _verify_latency_ms(middle) >= target_min_ms:
+            high = middle
+        else:
+            low = middle + 1
+    return low
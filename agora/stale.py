@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_
 
 from agora.models import Agent
 
@@ -49,6 +50,46 @@ def compute_agent_stale_metadata(
     )
 
 
+def compute_stale_metadata_bulk(
+    rows: Iterable[tuple[str, datetime | None, datetime]],
+    *,
+    now: datetime | None = None,
+    threshold_days: int = STALE_THRESHOLD_DAYS,
+) -> list[tuple[bool, int]]:
+    """
+    Compute stale fields for many `(health_status, last_healthy_at, registered_at)` rows.
+
+    Equivalent to calling `compute_stale_metadata` per row, but the clock read and the
+    stale cutoff are computed once for the whole batch.
+    """
+
+    now_utc = now or datetime.now(tz=timezone.utc)
+    stale_cutoff = now_utc - timedelta(days=threshold_days)
+    results: list[tuple[bool, int]] = []
+    for health_status, last_healthy_at, registered_at in rows:
+        reference = last_healthy_at or registered_at
+        if health_status != "unhealthy" or reference >= stale_cutoff:
+            results.append((False, 0))
+        else:
+            results.append((True, (now_utc - reference).days))
+    return results
+
+
+def compute_agent_stale_metadata_bulk(
+    agents: Iterable[Agent],
+    *,
+    now: datetime | None = None,
+    threshold_days: int = STALE_THRESHOLD_DAYS,
+) -> list[tuple[bool, int]]:
+    """Convenience wrapper of `compute_stale_metadata_bulk` for model instances."""
+
+    return compute_stale_metadata_bulk(
+        ((agent.health_status, agent.last_healthy_at, agent.registered_at) for agent in agents),
+        now=now,
+        threshold_days=threshold_days,
+    )
+
+
 def stale_filter_expression(
     now: datetime,
     *,
@@ -56,11 +97,7 @@ def stale_filter_expression(
 ) -> Any:
     """SQLAlchemy expression implementing stale=true semantics."""
 
+    # `stale_since` is coalesce(last_healthy_at, registered_at), backed by a partial
+    # index on unhealthy agents, so this is a single range scan.
     stale_cutoff = now - timedelta(days=threshold_days)
-    return and_(
-        Agent.health_status == "unhealthy",
-        or_(
-            and_(Agent.last_healthy_at.is_not(None), Agent.last_healthy_at < stale_cutoff),
-            and_(Agent.last_healthy_at.is_(None), Agent.registered_at < stale_cutoff),
-        ),
-    )
+    return and_(Agent.health_status == "unhealthy", Agent.stale_since < stale_cutoff)
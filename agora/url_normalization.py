@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from urllib.parse import SplitResult, urlsplit, urlunsplit
+from functools import lru_cache
+import re
+from urllib.parse import SplitResult, urlsplit
 
 
 class URLNormalizationError(ValueError):
     """Raised when an agent URL cannot be normalized."""
 
 
+# URLs that already satisfy every canonical rule: lowercase ASCII host, no userinfo,
+# no zero-padded port, non-empty path without a trailing slash, non-empty query and no
+# fragment. Printable ASCII only, so urlsplit's character stripping never applies.
+_CANONICAL_URL_RE = re.compile(
+    r"(?P<scheme>https?)://[a-z0-9.-]+(?::(?P<port>[1-9][0-9]{0,4}))?"
+    r"(?:/|(?:/[!\"$-.0->@-~]*)*/[!\"$-.0->@-~]+)"
+    r"(?:\?[!\"$-~]+)?"
+)
+
+
+@lru_cache(maxsize=2048)
+def split_url(url: str) -> SplitResult:
+    """
+    Return `urlsplit(url)`, memoized across callers.
+
+    The same agent URL typically flows through normalization and SSRF checks within a
+    single request; `SplitResult` is an immutable tuple, so sharing results is safe.
+    """
+
+    return urlsplit(url)
+
+
 def _build_normalized_netloc(parts: SplitResult, scheme: str) -> str:
     hostname = parts.hostname
     if not hostname:
@@ -35,8 +59,16 @@ def _build_normalized_netloc(parts: SplitResult, scheme: str) -> str:
 def normalize_url(url: str) -> str:
     """Normalize URLs using the strict MVP canonicalization rules."""
 
+    # Most stored and re-submitted URLs are already canonical; return them unparsed.
+    canonical = _CANONICAL_URL_RE.fullmatch(url)
+    if canonical is not None:
+        port = canonical["port"]
+        default_port = "80" if canonical["scheme"] == "http" else "443"
+        if port is None or (port != default_port and int(port) <= 65535):
+            return url
+
     try:
-        parts = urlsplit(url)
+        parts = split_url(url)
     except ValueError as exc:
         raise URLNormalizationError("URL is invalid") from exc
 
@@ -49,5 +81,8 @@ def normalize_url(url: str) -> str:
     if path != "/":
         path = path.rstrip("/") or "/"
 
-    # Preserve query exactly as provided and always drop fragments.
-    return urlunsplit((scheme, netloc, path, parts.query, ""))
+    # Preserve query exactly as provided and always drop fragments. The shape is fixed
+    # (scheme, host, absolute path), so assemble directly instead of via urlunsplit.
+    if parts.query:
+        return f"{scheme}://{netloc}{path}?{parts.query}"
+    return f"{scheme}://{netloc}{path}"
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_right
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 import ipaddress
 import socket
 from threading import Lock
-from urllib.parse import urlsplit
+
+from agora.ttl_cache import TTLCache
+from agora.url_normalization import split_url
 
 
 class URLSafetyError(ValueError):
@@ -23,21 +26,84 @@ class SafeOutboundTarget:
     pinned_ip: ipaddress.IPv4Address | ipaddress.IPv6Address
 
 
-_dns_pin_lock = Lock()
+# hostname -> (pinned IP, active pin count); consulted by the getaddrinfo wrapper below.
+_pinned_hosts: dict[str, tuple[str, int]] = {}
+_pinned_hosts_lock = Lock()
+_installed_getaddrinfo: object | None = None
+DNS_CACHE_TTL_SECONDS = 30
+_resolved_ips_cache: TTLCache[str, list[ipaddress.IPv4Address | ipaddress.IPv6Address]] = TTLCache(
+    max_entries=4096,
+    ttl_seconds=DNS_CACHE_TTL_SECONDS,
+)
+
+
+def _build_blocked_ranges(cidrs: tuple[str, ...]) -> tuple[list[int], list[int]]:
+    networks = ipaddress.collapse_addresses(ipaddress.ip_network(cidr) for cidr in cidrs)
+    starts: list[int] = []
+    ends: list[int] = []
+    for network in networks:
+        starts.append(int(network.network_address))
+        ends.append(int(network.broadcast_address))
+    return starts, ends
+
+
+# Private, loopback, link-local, multicast, reserved and unspecified ranges as defined
+# by the stdlib `ipaddress` properties, flattened into sorted integer ranges. Where
+# Python versions disagree, the broader definition is used.
+_BLOCKED_IPV4_RANGES = _build_blocked_ranges(
+    (
+        "0.0.0.0/8",
+        "10.0.0.0/8",
+        "127.0.0.0/8",
+        "169.254.0.0/16",
+        "172.16.0.0/12",
+        "192.0.0.0/24",
+        "192.0.2.0/24",
+        "192.168.0.0/16",
+        "198.18.0.0/15",
+        "198.51.100.0/24",
+        "203.0.113.0/24",
+        "224.0.0.0/4",
+        "240.0.0.0/4",
+        "255.255.255.255/32",
+    )
+)
+_BLOCKED_IPV6_RANGES = _build_blocked_ranges(
+    (
+        "::/8",
+        "64:ff9b:1::/48",
+        "100::/8",
+        "200::/7",
+        "400::/6",
+        "800::/5",
+        "1000::/4",
+        "2001::/23",
+        "2001:db8::/32",
+        "2002::/16",
+        "4000::/3",
+        "6000::/3",
+        "8000::/3",
+        "a000::/3",
+        "c000::/3",
+        "e000::/4",
+        "f000::/5",
+        "f800::/6",
+        "fc00::/7",
+        "fe00::/9",
+        "fe80::/10",
+        "ff00::/8",
+    )
+)
 
 
 def _is_blocked_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
-    return bool(
-        ip.is_private
-        or ip.is_loopback
-        or ip.is_link_local
-        or ip.is_multicast
-        or ip.is_reserved
-        or ip.is_unspecified
-    )
+    starts, ends = _BLOCKED_IPV4_RANGES if ip.version == 4 else _BLOCKED_IPV6_RANGES
+    value = int(ip)
+    index = bisect_right(starts, value) - 1
+    return index >= 0 and value <= ends[index]
 
 
-def _resolve_ips(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+def _lookup_ips(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
     records = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
     resolved: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
     seen: set[str] = set()
@@ -50,6 +116,37 @@ def _resolve_ips(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Ad
     return resolved
 
 
+def _resolve_ips(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+    cache_key = hostname.lower().rstrip(".")
+    cached = _resolved_ips_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    resolved = _lookup_ips(hostname)
+    _resolved_ips_cache.set(cache_key, resolved)
+    return resolved
+
+
+async def _resolve_ips_async(hostname: str) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+    cached = _resolved_ips_cache.get(hostname.lower().rstrip("."))
+    if cached is not None:
+        return cached
+    # Cache misses resolve in a worker thread so blocking DNS never stalls the event loop.
+    return await asyncio.to_thread(_resolve_ips, hostname)
+
+
+def invalidate_outbound_target(url: str) -> None:
+    """
+    Forget cached DNS results for a URL's host so the next safety check re-resolves it.
+
+    Call this after a connection failure to a pinned address; otherwise outbound checks
+    reuse the resolution for up to `DNS_CACHE_TTL_SECONDS`.
+    """
+
+    hostname = split_url(url).hostname
+    if hostname:
+        _resolved_ips_cache.pop(hostname.lower().rstrip("."))
+
+
 def _validate_hostname(
     hostname: str | None,
     *,
@@ -95,7 +192,7 @@ def assert_url_safe_for_registration(
 ) -> None:
     """Validate that a user-submitted URL does not target internal/private networks."""
 
-    parts = urlsplit(url)
+    parts = split_url(url)
     _validate_hostname(
         parts.hostname,
         allow_private=allow_private,
@@ -103,14 +200,14 @@ def assert_url_safe_for_registration(
     )
 
 
-def assert_url_safe_for_outbound(url: str, *, allow_private: bool = False) -> SafeOutboundTarget:
-    """Validate an outbound URL and return a hostname/IP tuple for pinned fetches."""
-
-    parts = urlsplit(url)
-    hostname = parts.hostname
+def _outbound_hostname(url: str) -> str:
+    hostname = split_url(url).hostname
     if hostname is None:
         raise URLSafetyError("URL must include a hostname")
+    return hostname
 
+
+def _literal_outbound_target(hostname: str, *, allow_private: bool) -> SafeOutboundTarget | None:
     lowered = hostname.lower()
     if lowered in {"localhost", "localhost.localdomain"}:
         raise URLSafetyError("Private or internal network targets are not allowed")
@@ -118,18 +215,19 @@ def assert_url_safe_for_outbound(url: str, *, allow_private: bool = False) -> Sa
     try:
         literal_ip = ipaddress.ip_address(lowered)
     except ValueError:
-        literal_ip = None
+        return None
 
-    if literal_ip is not None:
-        if not allow_private and _is_blocked_ip(literal_ip):
-            raise URLSafetyError("Private or internal network targets are not allowed")
-        return SafeOutboundTarget(hostname=hostname, pinned_ip=literal_ip)
+    if not allow_private and _is_blocked_ip(literal_ip):
+        raise URLSafetyError("Private or internal network targets are not allowed")
+    return SafeOutboundTarget(hostname=hostname, pinned_ip=literal_ip)
 
-    try:
-        resolved_ips = _resolve_ips(hostname)
-    except socket.gaierror as exc:
-        raise URLSafetyError("Unable to resolve target hostname") from exc
 
+def _resolved_outbound_target(
+    hostname: str,
+    resolved_ips: list[ipaddress.IPv4Address | ipaddress.IPv6Address],
+    *,
+    allow_private: bool,
+) -> SafeOutboundTarget:
     if not resolved_ips:
         raise URLSafetyError("Unable to resolve target hostname")
 
@@ -139,6 +237,67 @@ def assert_url_safe_for_outbound(url: str, *, allow_private: bool = False) -> Sa
     return SafeOutboundTarget(hostname=hostname, pinned_ip=resolved_ips[0])
 
 
+def assert_url_safe_for_outbound(url: str, *, allow_private: bool = False) -> SafeOutboundTarget:
+    """Validate an outbound URL and return a hostname/IP tuple for pinned fetches."""
+
+    hostname = _outbound_hostname(url)
+    literal_target = _literal_outbound_target(hostname, allow_private=allow_private)
+    if literal_target is not None:
+        return literal_target
+
+    try:
+        resolved_ips = _resolve_ips(hostname)
+    except socket.gaierror as exc:
+        raise URLSafetyError("Unable to resolve target hostname") from exc
+
+    return _resolved_outbound_target(hostname, resolved_ips, allow_private=allow_private)
+
+
+async def assert_url_safe_for_outbound_async(
+    url: str,
+    *,
+    allow_private: bool = False,
+) -> SafeOutboundTarget:
+    """Async variant of `assert_url_safe_for_outbound` that resolves DNS off the event loop."""
+
+    hostname = _outbound_hostname(url)
+    literal_target = _literal_outbound_target(hostname, allow_private=allow_private)
+    if literal_target is not None:
+        return literal_target
+
+    try:
+        resolved_ips = await _resolve_ips_async(hostname)
+    except socket.gaierror as exc:
+        raise URLSafetyError("Unable to resolve target hostname") from exc
+
+    return _resolved_outbound_target(hostname, resolved_ips, allow_private=allow_private)
+
+
+def _normalize_pinned_host(host: object) -> str:
+    host_text = host.decode("ascii", errors="ignore") if isinstance(host, bytes) else str(host)
+    return host_text.lower().rstrip(".")
+
+
+def _install_pinned_getaddrinfo() -> None:
+    """Wrap `socket.getaddrinfo` once so lookups for pinned hosts return the pinned IP."""
+
+    global _installed_getaddrinfo
+    if socket.getaddrinfo is _installed_getaddrinfo:
+        return
+
+    wrapped_getaddrinfo = socket.getaddrinfo
+
+    def _pinned_getaddrinfo(host: object, port: object, *args: object, **kwargs: object):
+        if host is not None and _pinned_hosts:
+            pinned = _pinned_hosts.get(_normalize_pinned_host(host))
+            if pinned is not None:
+                return wrapped_getaddrinfo(pinned[0], port, *args, **kwargs)
+        return wrapped_getaddrinfo(host, port, *args, **kwargs)
+
+    socket.getaddrinfo = _pinned_getaddrinfo  # type: ignore[assignment]
+    _installed_getaddrinfo = _pinned_getaddrinfo
+
+
 @asynccontextmanager
 async def pin_hostname_resolution(
     hostname: str,
@@ -148,27 +307,21 @@ async def pin_hostname_resolution(
     Temporarily pin DNS resolution for one hostname to one validated IP address.
 
     This closes the DNS check/use gap by ensuring outbound HTTP connection setup
-    cannot re-resolve the hostname to a different address mid-request.
+    cannot re-resolve the hostname to a different address mid-request. Pins are
+    tracked per hostname, so fetches to different hosts proceed concurrently.
     """
 
     normalized_hostname = hostname.lower().rstrip(".")
-    original_getaddrinfo = socket.getaddrinfo
-    pinned_ip_str = str(pinned_ip)
-
-    def _patched_getaddrinfo(host: object, port: object, *args: object, **kwargs: object):
-        host_text: str
-        if isinstance(host, bytes):
-            host_text = host.decode("ascii", errors="ignore")
-        else:
-            host_text = str(host)
-        if host_text.lower().rstrip(".") == normalized_hostname:
-            return original_getaddrinfo(pinned_ip_str, port, *args, **kwargs)
-        return original_getaddrinfo(host, port, *args, **kwargs)
-
-    await asyncio.to_thread(_dns_pin_lock.acquire)
-    socket.getaddrinfo = _patched_getaddrinfo  # type: ignore[assignment]
+    with _pinned_hosts_lock:
+        _install_pinned_getaddrinfo()
+        _, active_pins = _pinned_hosts.get(normalized_hostname, ("", 0))
+        _pinned_hosts[normalized_hostname] = (str(pinned_ip), active_pins + 1)
     try:
         yield
     finally:
-        socket.getaddrinfo = original_getaddrinfo  # type: ignore[assignment]
-        _dns_pin_lock.release()
+        with _pinned_hosts_lock:
+            current_ip, active_pins = _pinned_hosts[normalized_hostname]
+            if active_pins <= 1:
+                del _pinned_hosts[normalized_hostname]
+            else:
+                _pinned_hosts[normalized_hostname] = (current_ip, active_pins - 1)
@@ -3,21 +3,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import re
 from typing import Annotated, Any
 
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydantic import (
+    AnyHttpUrl,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from agora.url_normalization import normalize_url
 
 MAX_AGENT_NAME_LENGTH = 255
 MAX_AGENT_DESCRIPTION_LENGTH = 4000
 MAX_AGENT_URL_LENGTH = 2048
 MAX_AGENT_VERSION_LENGTH = 50
 MAX_PROTOCOL_VERSION_LENGTH = 20
+MAX_AGENT_SKILLS = 256
 MAX_SKILL_ID_LENGTH = 255
 MAX_SKILL_NAME_LENGTH = 255
 MAX_SKILL_DESCRIPTION_LENGTH = 2000
 MAX_OPERATOR_NAME_LENGTH = 255
 MAX_OPERATOR_URL_LENGTH = 2048
 
+_WHITESPACE_RE = re.compile(r"\s")
+# Hostnames after IDNA encoding must be LDH labels; IP literals also match this shape.
+_HOSTNAME_RE = re.compile(
+    r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)*[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.?"
+    r"|\[[0-9a-f:.]+\]"
+)
+_HTTP_URL_ADAPTER = TypeAdapter(AnyHttpUrl)
+
 
 class SkillCard(BaseModel):
     """Subset of the A2A skill schema used by Agora MVP."""
@@ -62,10 +82,10 @@ class AgentCard(BaseModel):
     )
     name: str = Field(min_length=1, max_length=MAX_AGENT_NAME_LENGTH)
     description: str | None = Field(default=None, max_length=MAX_AGENT_DESCRIPTION_LENGTH)
-    url: Annotated[AnyHttpUrl, Field(max_length=MAX_AGENT_URL_LENGTH)]
+    url: str = Field(min_length=1, max_length=MAX_AGENT_URL_LENGTH)
     version: str | None = Field(default=None, max_length=MAX_AGENT_VERSION_LENGTH)
     capabilities: dict[str, bool] = Field(default_factory=dict)
-    skills: list[SkillCard] = Field(min_length=1)
+    skills: list[SkillCard] = Field(min_length=1, max_length=MAX_AGENT_SKILLS)
     default_input_modes: list[str] = Field(default_factory=list, alias="defaultInputModes")
     default_output_modes: list[str] = Field(default_factory=list, alias="defaultOutputModes")
     authentication: dict[str, Any] | None = None
@@ -73,10 +93,25 @@ class AgentCard(BaseModel):
 
     @field_validator("url")
     @classmethod
-    def _validate_url_length(cls, value: AnyHttpUrl) -> AnyHttpUrl:
-        if len(str(value)) > MAX_AGENT_URL_LENGTH:
+    def _normalize_url(cls, value: str) -> str:
+        if _WHITESPACE_RE.search(value):
+            raise ValueError("URL must not contain whitespace")
+        # Parse as a WHATWG URL first so IDN hosts become punycode and non-ASCII paths
+        # are percent-encoded; otherwise one endpoint could register under two spellings.
+        try:
+            parsed = _HTTP_URL_ADAPTER.validate_python(value)
+        except ValidationError as exc:
+            raise ValueError(exc.errors()[0]["msg"]) from None
+        if parsed.host is None or _HOSTNAME_RE.fullmatch(parsed.host) is None:
+            raise ValueError("URL host contains invalid characters")
+        normalized = normalize_url(str(parsed))
+        if len(normalized) > MAX_AGENT_URL_LENGTH:
             raise ValueError(f"String should have at most {MAX_AGENT_URL_LENGTH} characters")
-        return value
+        return normalized
+
+
+# Built once at import so each validation reuses the compiled pydantic-core validator.
+_AGENT_CARD_ADAPTER = TypeAdapter(AgentCard)
 
 
 @dataclass(slots=True)
@@ -113,17 +148,6 @@ class AgentCardValidationError(ValueError):
         return cls(details)
 
 
-def _dedupe_preserving_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        result.append(value)
-    return result
-
-
 def validate_agent_card(agent_card_payload: dict[str, Any]) -> ValidatedAgentCard:
     """
     Validate an Agent Card payload and extract searchable fields.
@@ -133,29 +157,51 @@ def validate_agent_card(agent_card_payload: dict[str, Any]) -> ValidatedAgentCar
     """
 
     try:
-        card = AgentCard.model_validate(agent_card_payload)
+        card = _AGENT_CARD_ADAPTER.validate_python(agent_card_payload)
     except ValidationError as exc:
         raise AgentCardValidationError.from_pydantic_error(exc) from exc
+    return _extract_validated_agent_card(card)
 
-    extracted_skills = _dedupe_preserving_order([skill.id for skill in card.skills])
-    extracted_tags = _dedupe_preserving_order(
-        [tag for skill in card.skills for tag in skill.tags if tag]
-    )
-    extracted_capabilities = _dedupe_preserving_order(
-        [name for name, enabled in card.capabilities.items() if enabled]
-    )
-    extracted_input_modes = _dedupe_preserving_order(
-        [*card.default_input_modes, *[mode for skill in card.skills for mode in skill.input_modes]]
-    )
-    extracted_output_modes = _dedupe_preserving_order(
-        [*card.default_output_modes, *[mode for skill in card.skills for mode in skill.output_modes]]
-    )
+
+def validate_agent_card_json(agent_card_json: bytes | str) -> ValidatedAgentCard:
+    """
+    Validate a raw JSON Agent Card document and extract searchable fields.
+
+    Parsing and validation happen in one pydantic-core pass, skipping the intermediate
+    Python dict that `json.loads` + `validate_agent_card` would build.
+
+    Raises:
+        AgentCardValidationError: when the document is not valid JSON or fails schema rules.
+    """
+
+    try:
+        card = _AGENT_CARD_ADAPTER.validate_json(agent_card_json)
+    except ValidationError as exc:
+        raise AgentCardValidationError.from_pydantic_error(exc) from exc
+    return _extract_validated_agent_card(card)
+
+
+def _extract_validated_agent_card(card: AgentCard) -> ValidatedAgentCard:
+    # Accumulate every extracted field in one pass over skills; dict keys dedupe while
+    # preserving first-seen order.
+    extracted_skills: dict[str, None] = {}
+    extracted_tags: dict[str, None] = {}
+    extracted_input_modes = dict.fromkeys(card.default_input_modes)
+    extracted_output_modes = dict.fromkeys(card.default_output_modes)
+    for skill in card.skills:
+        extracted_skills[skill.id] = None
+        for tag in skill.tags:
+            if tag:
+                extracted_tags[tag] = None
+        extracted_input_modes.update(dict.fromkeys(skill.input_modes))
+        extracted_output_modes.update(dict.fromkeys(skill.output_modes))
+    extracted_capabilities = [name for name, enabled in card.capabilities.items() if enabled]
 
     return ValidatedAgentCard(
         card=card,
-        skills=extracted_skills,
-        tags=extracted_tags,
+        skills=list(extracted_skills),
+        tags=list(extracted_tags),
         capabilities=extracted_capabilities,
-        input_modes=extracted_input_modes,
-        output_modes=extracted_output_modes,
+        input_modes=list(extracted_input_modes),
+        output_modes=list(extracted_output_modes),
     )
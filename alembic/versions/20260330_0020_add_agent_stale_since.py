@@ -0,0 +1,42 @@
+"""add generated stale_since column and partial index to agents
+
+Revision ID: 20260330_0020
+Revises: 20260329_0019
+Create Date: 2026-03-30 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20260330_0020"
+down_revision = "20260329_0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agents",
+        sa.Column(
+            "stale_since",
+            sa.DateTime(timezone=True),
+            sa.Computed("coalesce(last_healthy_at, registered_at)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_agents_stale_since",
+        "agents",
+        ["stale_since"],
+        unique=False,
+        postgresql_where=sa.text("health_status = 'unhealthy'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_agents_stale_since", table_name="agents")
+    op.drop_column("agents", "stale_since")
@@ -0,0 +1,72 @@
+"""replace reliability scores materialized view with an upserted rollup table
+
+Revision ID: 20260331_0021
+Revises: 20260330_0020
+Create Date: 2026-03-31 09:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20260331_0021"
+down_revision = "20260330_0020"
+branch_labels = None
+depends_on = None
+
+
+_RELIABILITY_SCORES_SELECT = """
+    SELECT
+        agent_id,
+        COUNT(*)::int AS sample_size,
+        AVG(CASE WHEN response_received THEN 100.0 ELSE 0.0 END) AS uptime_pct,
+        AVG(CASE WHEN response_valid THEN 100.0 ELSE 0.0 END) AS response_valid_pct,
+        AVG(CASE WHEN terms_honored THEN 100.0 ELSE 0.0 END) AS terms_honored_pct,
+        AVG(response_time_ms)::float AS avg_latency_ms,
+        (
+            COALESCE(AVG(CASE WHEN response_received THEN 100.0 ELSE 0.0 END), 0)
+            + COALESCE(AVG(CASE WHEN response_valid THEN 100.0 ELSE 0.0 END), 0)
+            + COALESCE(AVG(CASE WHEN terms_honored THEN 100.0 ELSE 0.0 END), 0)
+        ) / 3.0 AS availability_score,
+        MAX(created_at) AS last_report_at
+    FROM reliability_reports
+    WHERE created_at > NOW() - INTERVAL '30 days'
+      AND retracted_at IS NULL
+      AND (held_until IS NULL OR held_until <= NOW())
+    GROUP BY agent_id
+"""
+
+
+def upgrade() -> None:
+    op.drop_index("idx_reliability_scores_agent", table_name="agent_reliability_scores")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS agent_reliability_scores")
+
+    op.create_table(
+        "agent_reliability_scores",
+        sa.Column("agent_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("sample_size", sa.Integer(), nullable=False),
+        sa.Column("uptime_pct", sa.Numeric(), nullable=True),
+        sa.Column("response_valid_pct", sa.Numeric(), nullable=True),
+        sa.Column("terms_honored_pct", sa.Numeric(), nullable=True),
+        sa.Column("avg_latency_ms", sa.Float(), nullable=True),
+        sa.Column("availability_score", sa.Numeric(), nullable=True),
+        sa.Column("last_report_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["agent_id"], ["agents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("agent_id"),
+    )
+    op.execute(f"INSERT INTO agent_reliability_scores {_RELIABILITY_SCORES_SELECT}")
+
+
+def downgrade() -> None:
+    op.drop_table("agent_reliability_scores")
+    op.execute(f"CREATE MATERIALIZED VIEW agent_reliability_scores AS {_RELIABILITY_SCORES_SELECT}")
+    op.create_index(
+        "idx_reliability_scores_agent",
+        "agent_reliability_scores",
+        ["agent_id"],
+        unique=True,
+    )
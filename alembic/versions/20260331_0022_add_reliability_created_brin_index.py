@@ -0,0 +1,39 @@
+"""add BRIN index on reliability_reports.created_at
+
+Revision ID: 20260331_0022
+Revises: 20260331_0021
+Create Date: 2026-03-31 10:15:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260331_0022"
+down_revision = "20260331_0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block; build without blocking report writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_reliability_created_brin",
+            "reliability_reports",
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_reliability_created_brin",
+            table_name="reliability_reports",
+            postgresql_concurrently=True,
+        )
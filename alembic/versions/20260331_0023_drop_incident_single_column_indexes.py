@@ -0,0 +1,42 @@
+"""drop low-selectivity single-column indexes on incident_reports
+
+Revision ID: 20260331_0023
+Revises: 20260331_0022
+Create Date: 2026-03-31 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20260331_0023"
+down_revision = "20260331_0022"
+branch_labels = None
+depends_on = None
+
+
+_DROPPED_INDEXES = (
+    ("idx_incidents_category", "category"),
+    ("idx_incidents_outcome", "outcome"),
+    ("idx_incidents_visibility", "visibility"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _column in _DROPPED_INDEXES:
+            op.drop_index(index_name, table_name="incident_reports", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, column in _DROPPED_INDEXES:
+            op.create_index(
+                index_name,
+                "incident_reports",
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+            )
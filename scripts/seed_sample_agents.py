@@ -2,122 +2,130 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from dataclasses import dataclass
 
 import httpx
 
+MAX_CONCURRENT_REQUESTS = 32
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SeedAgent:
     api_key: str
     card: dict[str, object]
 
 
-def build_seed_agents() -> list[SeedAgent]:
-    return [
-        SeedAgent(
-            api_key="seed-weather-key",
-            card={
-                "protocolVersion": "0.3.0",
-                "name": "Weather Watch",
-                "description": "Current conditions and 7-day forecasts for major cities.",
-                "url": "https://sample.agora.example/weather",
-                "version": "1.0.0",
-                "capabilities": {"streaming": True},
-                "skills": [
-                    {
-                        "id": "weather-forecast",
-                        "name": "Weather Forecast",
-                        "description": "Forecast and severe weather lookup.",
-                        "tags": ["weather", "forecast", "alerts"],
-                        "inputModes": ["application/json"],
-                        "outputModes": ["application/json"],
-                    }
-                ],
-                "defaultInputModes": ["application/json"],
-                "defaultOutputModes": ["application/json"],
-            },
-        ),
-        SeedAgent(
-            api_key="seed-research-key",
-            card={
-                "protocolVersion": "0.3.0",
-                "name": "Research Scout",
-                "description": "Finds papers and summarizes key findings by topic.",
-                "url": "https://sample.agora.example/research",
-                "version": "1.0.0",
-                "capabilities": {"streaming": True},
-                "skills": [
-                    {
-                        "id": "paper-search",
-                        "name": "Paper Search",
-                        "description": "Literature lookup and citation summary.",
-                        "tags": ["research", "science", "citations"],
-                        "inputModes": ["application/json"],
-                        "outputModes": ["application/json"],
-                    }
-                ],
-                "defaultInputModes": ["application/json"],
-                "defaultOutputModes": ["application/json"],
-            },
-        ),
-        SeedAgent(
-            api_key="seed-code-key",
-            card={
-                "protocolVersion": "0.3.0",
-                "name": "Code Copilot",
-                "description": "Generates and reviews code snippets for common tasks.",
-                "url": "https://sample.agora.example/code",
-                "version": "1.0.0",
-                "capabilities": {"streaming": True, "batch": True},
-                "skills": [
-                    {
-                        "id": "code-generation",
-                        "name": "Code Generation",
-                        "description": "Generate, explain, and refactor code.",
-                        "tags": ["code", "programming", "review"],
-                        "inputModes": ["application/json"],
-                        "outputModes": ["application/json"],
-                    }
-                ],
-                "defaultInputModes": ["application/json"],
-                "defaultOutputModes": ["application/json"],
-            },
-        ),
-        SeedAgent(
-            api_key="seed-translation-key",
-            card={
-                "protocolVersion": "0.3.0",
-                "name": "Translate Pro",
-                "description": "Low-latency translation across major world languages.",
-                "url": "https://sample.agora.example/translation",
-                "version": "1.0.0",
-                "capabilities": {"streaming": True},
-                "skills": [
-                    {
-                        "id": "translation",
-                        "name": "Translation",
-                        "description": "Translate text while preserving tone.",
-                        "tags": ["translation", "localization", "language"],
-                        "inputModes": ["application/json"],
-                        "outputModes": ["application/json"],
-                    }
-                ],
-                "defaultInputModes": ["application/json"],
-                "defaultOutputModes": ["application/json"],
-            },
-        ),
-    ]
-
-
-def seed_agent(client: httpx.Client, base_url: str, spec: SeedAgent) -> tuple[str, str]:
+SEED_AGENTS: tuple[SeedAgent, ...] = (
+    SeedAgent(
+        api_key="seed-weather-key",
+        card={
+            "protocolVersion": "0.3.0",
+            "name": "Weather Watch",
+            "description": "Current conditions and 7-day forecasts for major cities.",
+            "url": "https://sample.agora.example/weather",
+            "version": "1.0.0",
+            "capabilities": {"streaming": True},
+            "skills": [
+                {
+                    "id": "weather-forecast",
+                    "name": "Weather Forecast",
+                    "description": "Forecast and severe weather lookup.",
+                    "tags": ["weather", "forecast", "alerts"],
+                    "inputModes": ["application/json"],
+                    "outputModes": ["application/json"],
+                }
+            ],
+            "defaultInputModes": ["application/json"],
+            "defaultOutputModes": ["application/json"],
+        },
+    ),
+    SeedAgent(
+        api_key="seed-research-key",
+        card={
+            "protocolVersion": "0.3.0",
+            "name": "Research Scout",
+            "description": "Finds papers and summarizes key findings by topic.",
+            "url": "https://sample.agora.example/research",
+            "version": "1.0.0",
+            "capabilities": {"streaming": True},
+            "skills": [
+                {
+                    "id": "paper-search",
+                    "name": "Paper Search",
+                    "description": "Literature lookup and citation summary.",
+                    "tags": ["research", "science", "citations"],
+                    "inputModes": ["application/json"],
+                    "outputModes": ["application/json"],
+                }
+            ],
+            "defaultInputModes": ["application/json"],
+            "defaultOutputModes": ["application/json"],
+        },
+    ),
+    SeedAgent(
+        api_key="seed-code-key",
+        card={
+            "protocolVersion": "0.3.0",
+            "name": "Code Copilot",
+            "description": "Generates and reviews code snippets for common tasks.",
+            "url": "https://sample.agora.example/code",
+            "version": "1.0.0",
+            "capabilities": {"streaming": True, "batch": True},
+            "skills": [
+                {
+                    "id": "code-generation",
+                    "name": "Code Generation",
+                    "description": "Generate, explain, and refactor code.",
+                    "tags": ["code", "programming", "review"],
+                    "inputModes": ["application/json"],
+                    "outputModes": ["application/json"],
+                }
+            ],
+            "defaultInputModes": ["application/json"],
+            "defaultOutputModes": ["application/json"],
+        },
+    ),
+    SeedAgent(
+        api_key="seed-translation-key",
+        card={
+            "protocolVersion": "0.3.0",
+            "name": "Translate Pro",
+            "description": "Low-latency translation across major world languages.",
+            "url": "https://sample.agora.example/translation",
+            "version": "1.0.0",
+            "capabilities": {"streaming": True},
+            "skills": [
+                {
+                    "id": "translation",
+                    "name": "Translation",
+                    "description": "Translate text while preserving tone.",
+                    "tags": ["translation", "localization", "language"],
+                    "inputModes": ["application/json"],
+                    "outputModes": ["application/json"],
+                }
+            ],
+            "defaultInputModes": ["application/json"],
+            "defaultOutputModes": ["application/json"],
+        },
+    ),
+)
+
+
+async def seed_agent(
+    client: httpx.AsyncClient,
+    base_url: str,
+    spec: SeedAgent,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, str]:
     try:
-        response = client.post(
-            f"{base_url.rstrip('/')}/api/v1/agents",
-            headers={"X-API-Key": spec.api_key},
-            json=spec.card,
-        )
+        async with semaphore:
+            response = await client.post(
+                f"{base_url.rstrip('/')}/api/v1/agents",
+                headers={"X-API-Key": spec.api_key},
+                json=spec.card,
+            )
     except httpx.HTTPError as exc:
         return ("error", f"request_failed: {exc}")
 
@@ -136,6 +144,12 @@ def seed_agent(client: httpx.Client, base_url: str, spec: SeedAgent) -> tuple[st
     return ("error", f"status={response.status_code} detail={detail}")
 
 
+async def seed_all(base_url: str, agents: tuple[SeedAgent, ...]) -> list[tuple[str, str]]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with httpx.AsyncClient(timeout=10) as client:
+        return await asyncio.gather(*(seed_agent(client, base_url, spec, semaphore) for spec in agents))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Seed Agora with sample agents")
     parser.add_argument(
@@ -145,13 +159,11 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    agents = build_seed_agents()
-    print(f"Seeding {len(agents)} sample agents into {args.base_url}...")
+    print(f"Seeding {len(SEED_AGENTS)} sample agents into {args.base_url}...")
 
-    with httpx.Client(timeout=10) as client:
-        for spec in agents:
-            outcome, info = seed_agent(client, args.base_url, spec)
-            print(f"- {spec.card['name']}: {outcome} ({info})")
+    results = asyncio.run(seed_all(args.base_url, SEED_AGENTS))
+    for spec, (outcome, info) in zip(SEED_AGENTS, results):
+        print(f"- {spec.card['name']}: {outcome} ({info})")
 
     return 0
 
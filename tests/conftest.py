@@ -1,6 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 import sys
 from pathlib import Path
 
+from argon2 import PasswordHasher
+import pytest
+from pytest_asyncio import is_async_test
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Run every async test on the session loop so session-scoped fixtures
+    # (HTTP client, pooled DB connections) can be shared safely.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_api_key_hashing() -> Iterator[None]:
+    # Production Argon2 parameters cost tens of ms per hash; tests only need the
+    # same hash format, so use the cheapest parameters the library accepts.
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(
+            "agora.security._API_KEY_HASHER",
+            PasswordHasher(time_cost=1, memory_cost=8, parallelism=1),
+        )
+        yield
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from agora.database import AsyncSessionLocal
+from agora.models import Agent
+from tests.integration._payloads import build_payload
+
+
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    name: str
+    url: str
+    skill_id: str = "weather"
+    protocol_version: str | None = None
+    health_status: str = "unknown"
+    registered_at: datetime | None = None
+    last_healthy_at: datetime | None = None
+
+
+def _build_agent(spec: AgentSpec) -> Agent:
+    agent = Agent(
+        name=spec.name,
+        description=f"{spec.name} description",
+        url=spec.url,
+        version="1.0.0",
+        protocol_version=spec.protocol_version,
+        agent_card=build_payload(spec.name, spec.url, spec.skill_id),
+        skills=[spec.skill_id],
+        capabilities=["streaming"],
+        tags=[],
+        input_modes=[],
+        output_modes=[],
+        health_status=spec.health_status,
+        last_healthy_at=spec.last_healthy_at,
+    )
+    if spec.registered_at is not None:
+        agent.registered_at = spec.registered_at
+    return agent
+
+
+async def seed_agents(specs: Sequence[AgentSpec]) -> list[str]:
+    """Insert agents directly for tests whose subject is not registration; returns their ids."""
+
+    agents = [_build_agent(spec) for spec in specs]
+    async with AsyncSessionLocal() as session:
+        session.add_all(agents)
+        await session.commit()
+    return [str(agent.id) for agent in agents]
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+
+def build_payload(
+    name: str,
+    url: str,
+    skill_id: str = "weather",
+    *,
+    did: str | None = None,
+    protocol_version: str | None = None,
+) -> dict:
+    body = {
+        "protocolVersion": "0.3.0",
+        "name": name,
+        "description": f"{name} description",
+        "url": url,
+        "version": "1.0.0",
+        "capabilities": {"streaming": True},
+        "skills": [{"id": skill_id, "name": f"{skill_id} skill"}],
+    }
+    if did is not None:
+        body["did"] = did
+    if protocol_version is not None:
+        body["protocol_version"] = protocol_version
+    return body
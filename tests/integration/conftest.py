@@ -1,36 +1,44 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 import ipaddress
 
 import httpx
+import pytest
 import pytest_asyncio
-from sqlalchemy import delete, text
+from sqlalchemy import event, text
 
 import agora.main as main_module
-from agora.database import AsyncSessionLocal, close_engine
+from agora.database import AsyncSessionLocal, close_engine, engine
 from agora.main import app
-from agora.models import Agent, AgentIncident, AgentReliabilityReport
+
+_FAKE_RESOLVED_IPS = [ipaddress.ip_address("93.184.216.34")]
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _skip_commit_fsync(dbapi_connection, _connection_record) -> None:
+    # Test data is disposable; don't wait for WAL flushes on every commit.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET synchronous_commit TO off")
+    cursor.close()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fake_dns_resolution() -> Iterator[None]:
+    # Module-scoped so the patch is applied once per test module, not per test;
+    # individual tests may still override it with their own monkeypatch.
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr("agora.url_safety._resolve_ips", lambda _hostname: _FAKE_RESOLVED_IPS)
+        yield
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def clean_state(monkeypatch) -> None:
     async with AsyncSessionLocal() as session:
-        try:
-            await session.execute(delete(AgentIncident))
-            await session.execute(delete(AgentReliabilityReport))
-            await session.execute(delete(Agent))
-            await session.execute(text("REFRESH MATERIALIZED VIEW agent_reliability_scores"))
-        except Exception:
-            # Migration may not be applied in all test contexts.
-            await session.rollback()
-            await session.execute(delete(Agent))
+        # Reports, incidents and the reliability score rollup all cascade from agents.
+        await session.execute(text("TRUNCATE agents CASCADE"))
         await session.commit()
 
-    monkeypatch.setattr(
-        "agora.url_safety._resolve_ips",
-        lambda _hostname: [ipaddress.ip_address("93.184.216.34")],
-    )
-
     async def _no_erc8004_discovery(
         _endpoint_url: str,
         *,
@@ -44,13 +52,24 @@ async def clean_state(monkeypatch) -> None:
     await main_module.rate_limiter.reset()
     main_module.query_tracker._last_queried.clear()
     main_module.latest_registry_snapshot = None
+    main_module.registry_snapshot_build = None
     main_module.request_metrics.clear()
     yield
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _dispose_engine() -> AsyncIterator[None]:
+    # Tests share one event loop, so pooled connections stay valid until the session ends.
+    yield
     await close_engine()
 
 
-@pytest_asyncio.fixture
-async def client() -> httpx.AsyncClient:
-    transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+@pytest_asyncio.fixture(scope="session")
+async def _transport() -> AsyncIterator[httpx.ASGITransport]:
+    yield httpx.ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(_transport: httpx.ASGITransport) -> AsyncIterator[httpx.AsyncClient]:
+    async with httpx.AsyncClient(transport=_transport, base_url="http://testserver") as test_client:
         yield test_client
@@ -17,6 +17,11 @@ async def _noop_pin_hostname_resolution(_hostname: str, _pinned_ip: str):
     yield
 
 
+async def _safe_target(_url: str, *, allow_private: bool = False) -> SimpleNamespace:
+    del allow_private
+    return SimpleNamespace(hostname="example.com", pinned_ip="93.184.216.34")
+
+
 def payload(
     name: str,
     url: str,
@@ -82,18 +87,12 @@ async def test_inline_commitments_are_indexed_and_exposed_via_api(client, monkey
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
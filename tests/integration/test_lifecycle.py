@@ -1,16 +1,6 @@
 from __future__ import annotations
 
-
-def build_payload(name: str, url: str, skill_id: str = "weather") -> dict:
-    return {
-        "protocolVersion": "0.3.0",
-        "name": name,
-        "description": f"{name} description",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": skill_id, "name": f"{skill_id} skill"}],
-    }
+from tests.integration._payloads import build_payload
 
 
 async def test_register_search_detail_update_delete_lifecycle(client) -> None:
@@ -26,7 +16,7 @@ async def test_register_search_detail_update_delete_lifecycle(client) -> None:
 
     search = await client.get("/api/v1/agents", params={"skill": "weather"})
     assert search.status_code == 200
-    assert any(agent["id"] == agent_id for agent in search.json()["agents"])
+    assert agent_id in {agent["id"] for agent in search.json()["agents"]}
 
     detail = await client.get(f"/api/v1/agents/{agent_id}")
     assert detail.status_code == 200
@@ -61,3 +51,24 @@ async def test_register_search_detail_update_delete_lifecycle(client) -> None:
 
     post_delete_detail = await client.get(f"/api/v1/agents/{agent_id}")
     assert post_delete_detail.status_code == 404
+
+
+async def test_idn_and_punycode_urls_register_as_the_same_agent(client) -> None:
+    register = await client.post(
+        "/api/v1/agents",
+        json=build_payload("IDN Agent", "https://bücher.example/a2a", "weather"),
+        headers={"X-API-Key": "idn-key"},
+    )
+    assert register.status_code == 201
+    agent_id = register.json()["id"]
+
+    detail = await client.get(f"/api/v1/agents/{agent_id}")
+    assert detail.status_code == 200
+    assert detail.json()["agent_card"]["url"] == "https://xn--bcher-kva.example/a2a"
+
+    duplicate = await client.post(
+        "/api/v1/agents",
+        json=build_payload("IDN Agent Copy", "https://xn--bcher-kva.example/a2a", "weather"),
+        headers={"X-API-Key": "idn-copy-key"},
+    )
+    assert duplicate.status_code == 409
@@ -1,31 +1,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import update
 
 import agora.main as main_module
 from agora.database import AsyncSessionLocal
 from agora.models import Agent
-from agora.security import api_key_fingerprint, hash_api_key
-
-
-def payload_for_recovery(url: str) -> dict:
-    return {
-        "protocolVersion": "0.3.0",
-        "name": "Recovery Agent",
-        "description": "Recovery flow test",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": "recover", "name": "Recover"}],
-    }
+from tests.integration._payloads import build_payload
 
 
 async def test_recovery_flow_rotates_key_and_invalidates_prior_token(client, monkeypatch) -> None:
     register = await client.post(
         "/api/v1/agents",
-        json=payload_for_recovery("https://example.com/recovery-flow"),
+        json=build_payload("Recovery Agent", "https://example.com/recovery-flow", "recover"),
         headers={"X-API-Key": "old-key"},
     )
     assert register.status_code == 201
@@ -68,7 +57,7 @@ async def test_recovery_flow_rotates_key_and_invalidates_prior_token(client, mon
     )
     assert complete.status_code == 200
 
-    update_payload = payload_for_recovery("https://example.com/recovery-flow")
+    update_payload = build_payload("Recovery Agent", "https://example.com/recovery-flow", "recover")
     old_key_update = await client.put(
         f"/api/v1/agents/{agent_id}",
         json=update_payload,
@@ -87,7 +76,7 @@ async def test_recovery_flow_rotates_key_and_invalidates_prior_token(client, mon
 async def test_recovery_complete_rejects_expired_challenge(client, monkeypatch) -> None:
     register = await client.post(
         "/api/v1/agents",
-        json=payload_for_recovery("https://example.com/recovery-expired"),
+        json=build_payload("Recovery Agent", "https://example.com/recovery-expired", "recover"),
         headers={"X-API-Key": "old-key"},
     )
     assert register.status_code == 201
@@ -98,12 +87,17 @@ async def test_recovery_complete_rejects_expired_challenge(client, monkeypatch)
     token = start.json()["challenge_token"]
     session_secret = start.json()["recovery_session_secret"]
 
+    # recovery/start already stored the challenge and session hashes; only age the challenge.
+    now = datetime.now(tz=timezone.utc)
     async with AsyncSessionLocal() as session:
-        agent = await session.scalar(select(Agent).where(Agent.id == agent_id))
-        agent.recovery_challenge_hash = hash_api_key(token)
-        agent.recovery_session_hash = api_key_fingerprint(session_secret)
-        agent.recovery_challenge_created_at = datetime.now(tz=timezone.utc) - timedelta(hours=1)
-        agent.recovery_challenge_expires_at = datetime.now(tz=timezone.utc) - timedelta(seconds=1)
+        await session.execute(
+            update(Agent)
+            .where(Agent.id == UUID(agent_id))
+            .values(
+                recovery_challenge_created_at=now - timedelta(hours=1),
+                recovery_challenge_expires_at=now - timedelta(seconds=1),
+            )
+        )
         await session.commit()
 
     async def fetch_token(_url: str, **_kwargs: object) -> str:
@@ -123,7 +117,7 @@ async def test_recovery_complete_rejects_expired_challenge(client, monkeypatch)
 async def test_recovery_complete_rejects_incorrect_session_secret(client, monkeypatch) -> None:
     register = await client.post(
         "/api/v1/agents",
-        json=payload_for_recovery("https://example.com/recovery-session"),
+        json=build_payload("Recovery Agent", "https://example.com/recovery-session", "recover"),
         headers={"X-API-Key": "old-key"},
     )
     assert register.status_code == 201
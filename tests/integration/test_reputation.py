@@ -1,23 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import agora.main as main_module
 from agora.database import AsyncSessionLocal
 from agora.models import Agent, AgentReliabilityReport
-
-
-def build_payload(name: str, url: str, skill_id: str = "weather") -> dict:
-    return {
-        "protocolVersion": "0.3.0",
-        "name": name,
-        "description": f"{name} description",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": skill_id, "name": f"{skill_id} skill"}],
-    }
+from tests.integration._payloads import build_payload
 
 
 async def _register_agent(
@@ -256,20 +246,25 @@ async def test_reputation_submission_rate_limits(client) -> None:
         "reporter-key",
     )
 
-    for idx in range(10):
-        response = await client.post(
-            f"/api/v1/agents/{subject_id}/reliability-reports",
-            json={
-                "interaction_date": "2026-02-23",
-                "response_received": True,
-                "response_time_ms": 100 + idx,
-                "response_valid": True,
-                "terms_honored": True,
-                "notes": f"report {idx}",
-            },
-            headers={"X-API-Key": "reporter-key"},
+    # Submissions within the quota are independent, so issue them concurrently.
+    accepted_reliability = await asyncio.gather(
+        *(
+            client.post(
+                f"/api/v1/agents/{subject_id}/reliability-reports",
+                json={
+                    "interaction_date": "2026-02-23",
+                    "response_received": True,
+                    "response_time_ms": 100 + idx,
+                    "response_valid": True,
+                    "terms_honored": True,
+                    "notes": f"report {idx}",
+                },
+                headers={"X-API-Key": "reporter-key"},
+            )
+            for idx in range(10)
         )
-        assert response.status_code == 201
+    )
+    assert all(response.status_code == 201 for response in accepted_reliability)
 
     blocked_reliability = await client.post(
         f"/api/v1/agents/{subject_id}/reliability-reports",
@@ -285,18 +280,22 @@ async def test_reputation_submission_rate_limits(client) -> None:
     )
     assert blocked_reliability.status_code == 429
 
-    for _ in range(5):
-        response = await client.post(
-            f"/api/v1/agents/{subject_id}/incidents",
-            json={
-                "category": "refusal_to_comply",
-                "description": "Weekly limit test incident.",
-                "outcome": "unresolved",
-                "visibility": "public",
-            },
-            headers={"X-API-Key": "reporter-key"},
+    accepted_incidents = await asyncio.gather(
+        *(
+            client.post(
+                f"/api/v1/agents/{subject_id}/incidents",
+                json={
+                    "category": "refusal_to_comply",
+                    "description": "Weekly limit test incident.",
+                    "outcome": "unresolved",
+                    "visibility": "public",
+                },
+                headers={"X-API-Key": "reporter-key"},
+            )
+            for _ in range(5)
         )
-        assert response.status_code == 201
+    )
+    assert all(response.status_code == 201 for response in accepted_incidents)
 
     blocked_incident = await client.post(
         f"/api/v1/agents/{subject_id}/incidents",
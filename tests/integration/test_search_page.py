@@ -8,30 +8,8 @@ from sqlalchemy import select
 import agora.main as main_module
 from agora.database import AsyncSessionLocal
 from agora.models import Agent
-
-
-def build_payload(
-    name: str,
-    url: str,
-    skill_id: str = "weather",
-    *,
-    did: str | None = None,
-    protocol_version: str | None = None,
-) -> dict:
-    body = {
-        "protocolVersion": "0.3.0",
-        "name": name,
-        "description": f"{name} description",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": skill_id, "name": f"{skill_id} skill"}],
-    }
-    if did is not None:
-        body["did"] = did
-    if protocol_version is not None:
-        body["protocol_version"] = protocol_version
-    return body
+from tests.integration._factories import AgentSpec, seed_agents
+from tests.integration._payloads import build_payload
 
 
 async def set_agent_health_state(
@@ -59,14 +37,7 @@ async def set_agent_json_verified(*, name: str, verified: bool) -> None:
 
 
 async def test_search_page_lists_registered_agents(client) -> None:
-    payload = build_payload("Search Page Agent", "https://example.com/search-page-agent")
-    register = await client.post(
-        "/api/v1/agents",
-        json=payload,
-        headers={"X-API-Key": "search-page-key"},
-    )
-    assert register.status_code == 201
-    agent_id = register.json()["id"]
+    [agent_id] = await seed_agents([AgentSpec("Search Page Agent", "https://example.com/search-page-agent")])
 
     response = await client.get("/search")
     assert response.status_code == 200
@@ -217,13 +188,7 @@ async def test_search_page_accepts_skill_filter(client) -> None:
 
 
 async def test_agents_api_accepts_all_and_stale_health_values(client) -> None:
-    payload = build_payload("Health Filter Agent", "https://example.com/health-filter-agent")
-    register = await client.post(
-        "/api/v1/agents",
-        json=payload,
-        headers={"X-API-Key": "health-filter-key"},
-    )
-    assert register.status_code == 201
+    await seed_agents([AgentSpec("Health Filter Agent", "https://example.com/health-filter-agent")])
 
     all_response = await client.get("/api/v1/agents", params=[("health", "all")])
     assert all_response.status_code == 200
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import update
 
 from agora.database import AsyncSessionLocal
 from agora.models import Agent
@@ -41,34 +42,27 @@ async def test_search_semantics_and_default_ordering(client) -> None:
         ids[name] = response.json()["id"]
 
     now = datetime.now(tz=timezone.utc)
+    health_states = [
+        ("healthy-new", "healthy", now - timedelta(hours=1), now - timedelta(hours=1)),
+        ("healthy-old", "healthy", now - timedelta(hours=3), now - timedelta(hours=3)),
+        ("unknown-new", "unknown", now - timedelta(hours=2), None),
+        ("unhealthy-recent", "unhealthy", now - timedelta(days=1), now - timedelta(days=2)),
+        ("unhealthy-stale-lasthealthy", "unhealthy", now - timedelta(days=10), now - timedelta(days=8)),
+        ("unhealthy-stale-never", "unhealthy", now - timedelta(days=9), None),
+    ]
     async with AsyncSessionLocal() as session:
-        rows = list((await session.scalars(select(Agent))).all())
-        by_name = {row.name: row for row in rows}
-
-        by_name["healthy-new"].health_status = "healthy"
-        by_name["healthy-new"].registered_at = now - timedelta(hours=1)
-        by_name["healthy-new"].last_healthy_at = now - timedelta(hours=1)
-
-        by_name["healthy-old"].health_status = "healthy"
-        by_name["healthy-old"].registered_at = now - timedelta(hours=3)
-        by_name["healthy-old"].last_healthy_at = now - timedelta(hours=3)
-
-        by_name["unknown-new"].health_status = "unknown"
-        by_name["unknown-new"].registered_at = now - timedelta(hours=2)
-        by_name["unknown-new"].last_healthy_at = None
-
-        by_name["unhealthy-recent"].health_status = "unhealthy"
-        by_name["unhealthy-recent"].registered_at = now - timedelta(days=1)
-        by_name["unhealthy-recent"].last_healthy_at = now - timedelta(days=2)
-
-        by_name["unhealthy-stale-lasthealthy"].health_status = "unhealthy"
-        by_name["unhealthy-stale-lasthealthy"].registered_at = now - timedelta(days=10)
-        by_name["unhealthy-stale-lasthealthy"].last_healthy_at = now - timedelta(days=8)
-
-        by_name["unhealthy-stale-never"].health_status = "unhealthy"
-        by_name["unhealthy-stale-never"].registered_at = now - timedelta(days=9)
-        by_name["unhealthy-stale-never"].last_healthy_at = None
-
+        await session.execute(
+            update(Agent),
+            [
+                {
+                    "id": UUID(ids[name]),
+                    "health_status": health_status,
+                    "registered_at": registered_at,
+                    "last_healthy_at": last_healthy_at,
+                }
+                for name, health_status, registered_at, last_healthy_at in health_states
+            ],
+        )
         await session.commit()
 
     default = await client.get("/api/v1/agents", params={"limit": 50})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from hashlib import sha256
 import socket
 
@@ -9,18 +10,9 @@ import agora.main as main_module
 from agora.database import AsyncSessionLocal
 from agora.metrics import BoundedRequestMetrics
 from agora.models import Agent
+from tests.integration._payloads import build_payload
 
-
-def payload(name: str, url: str) -> dict:
-    return {
-        "protocolVersion": "0.3.0",
-        "name": name,
-        "description": f"{name} description",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": "security", "name": "Security"}],
-    }
+LEGACY_OWNER_KEY_HASH = sha256(b"legacy-owner-key").hexdigest()
 
 
 async def test_registration_rate_limit_blocks_rotating_api_keys(client, monkeypatch) -> None:
@@ -28,17 +20,19 @@ async def test_registration_rate_limit_blocks_rotating_api_keys(client, monkeypa
     monkeypatch.setattr(main_module.settings, "registration_rate_limit_per_api_key", 100)
     monkeypatch.setattr(main_module.settings, "registration_rate_limit_global", 100)
 
-    statuses: list[int] = []
-    for idx in range(1, 5):
-        response = await client.post(
+    def register(idx: int):
+        return client.post(
             "/api/v1/agents",
-            json=payload(f"agent-{idx}", f"https://example.com/rl/{idx}"),
+            json=build_payload(f"agent-{idx}", f"https://example.com/rl/{idx}"),
             headers={"X-API-Key": f"rotating-key-{idx}"},
         )
-        statuses.append(response.status_code)
 
-    assert statuses[:3] == [201, 201, 201]
-    assert statuses[3] == 429
+    # The per-IP quota admits the first three regardless of arrival order.
+    within_limit = await asyncio.gather(*(register(idx) for idx in range(1, 4)))
+    assert [response.status_code for response in within_limit] == [201, 201, 201]
+
+    over_limit = await register(4)
+    assert over_limit.status_code == 429
 
 
 async def test_metrics_endpoint_requires_admin_token_and_hides_raw_paths(
@@ -56,7 +50,7 @@ async def test_metrics_endpoint_requires_admin_token_and_hides_raw_paths(
 
     register = await client.post(
         "/api/v1/agents",
-        json=payload("metrics-agent", "https://example.com/metrics/agent"),
+        json=build_payload("metrics-agent", "https://example.com/metrics/agent"),
         headers={"X-API-Key": "metrics-key"},
     )
     assert register.status_code == 201
@@ -81,7 +75,7 @@ async def test_metrics_endpoint_requires_admin_token_and_hides_raw_paths(
 async def test_registration_rejects_userinfo_urls(client) -> None:
     response = await client.post(
         "/api/v1/agents",
-        json=payload(
+        json=build_payload(
             "userinfo-agent",
             "https://trusted.example.com@attacker.example.net/a2a",
         ),
@@ -102,7 +96,7 @@ async def test_registration_rejects_unresolvable_hostnames(client, monkeypatch)
     )
     response = await client.post(
         "/api/v1/agents",
-        json=payload(
+        json=build_payload(
             "unresolved-agent",
             "https://nonexistent-subdomain-xyz-12345.invalid/a2a",
         ),
@@ -116,22 +110,21 @@ async def test_registration_rejects_unresolvable_hostnames(client, monkeypatch)
 async def test_legacy_owner_hash_is_upgraded_on_successful_auth(client) -> None:
     register = await client.post(
         "/api/v1/agents",
-        json=payload("legacy-owner", "https://example.com/legacy/owner"),
+        json=build_payload("legacy-owner", "https://example.com/legacy/owner"),
         headers={"X-API-Key": "legacy-owner-key"},
     )
     assert register.status_code == 201
     agent_id = register.json()["id"]
-    legacy_hash = sha256("legacy-owner-key".encode("utf-8")).hexdigest()
 
     async with AsyncSessionLocal() as session:
         agent = await session.scalar(select(Agent).where(Agent.id == agent_id))
         assert agent is not None
-        agent.owner_key_hash = legacy_hash
+        agent.owner_key_hash = LEGACY_OWNER_KEY_HASH
         await session.commit()
 
     updated = await client.put(
         f"/api/v1/agents/{agent_id}",
-        json=payload("legacy-owner-updated", "https://example.com/legacy/owner"),
+        json=build_payload("legacy-owner-updated", "https://example.com/legacy/owner"),
         headers={"X-API-Key": "legacy-owner-key"},
     )
     assert updated.status_code == 200
@@ -139,7 +132,7 @@ async def test_legacy_owner_hash_is_upgraded_on_successful_auth(client) -> None:
     async with AsyncSessionLocal() as session:
         agent = await session.scalar(select(Agent).where(Agent.id == agent_id))
         assert agent is not None
-        assert agent.owner_key_hash != legacy_hash
+        assert agent.owner_key_hash != LEGACY_OWNER_KEY_HASH
         assert str(agent.owner_key_hash).startswith("$argon2id$")
 
 
@@ -178,7 +171,7 @@ async def test_admin_endpoints_are_rate_limited_before_auth(client, monkeypatch)
 async def test_registration_rejects_oversized_name_with_400(client) -> None:
     response = await client.post(
         "/api/v1/agents",
-        json=payload("a" * 5000, "https://example.com/oversized-name"),
+        json=build_payload("a" * 5000, "https://example.com/oversized-name"),
         headers={"X-API-Key": "oversized-key"},
     )
     assert response.status_code == 400
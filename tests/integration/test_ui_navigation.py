@@ -7,27 +7,8 @@ from sqlalchemy import update
 
 from agora.database import AsyncSessionLocal
 from agora.models import Agent
-
-
-def build_payload(
-    name: str,
-    url: str,
-    skill_id: str = "weather",
-    *,
-    protocol_version: str | None = None,
-) -> dict:
-    payload = {
-        "protocolVersion": "0.3.0",
-        "name": name,
-        "description": f"{name} description",
-        "url": url,
-        "version": "1.0.0",
-        "capabilities": {"streaming": True},
-        "skills": [{"id": skill_id, "name": f"{skill_id} skill"}],
-    }
-    if protocol_version is not None:
-        payload["protocol_version"] = protocol_version
-    return payload
+from tests.integration._factories import AgentSpec, seed_agents
+from tests.integration._payloads import build_payload
 
 
 def _extract_health_rate_percent(page_html: str) -> int:
@@ -50,19 +31,9 @@ async def _set_agent_health_status(agent_id: str, status: str) -> None:
 
 
 async def test_homepage_agent_card_link_loads_detail_page(client) -> None:
-    payload = build_payload(
-        "Homepage Agent",
-        "https://example.com/homepage-agent",
-        "weather",
-        protocol_version="1.0.0",
-    )
-    register = await client.post(
-        "/api/v1/agents",
-        json=payload,
-        headers={"X-API-Key": "homepage-agent-key"},
+    [agent_id] = await seed_agents(
+        [AgentSpec("Homepage Agent", "https://example.com/homepage-agent", protocol_version="1.0.0")]
     )
-    assert register.status_code == 201
-    agent_id = register.json()["id"]
 
     home = await client.get("/")
     assert home.status_code == 200
@@ -13,6 +13,11 @@ async def _noop_pin_hostname_resolution(_hostname: str, _pinned_ip: str):
     yield
 
 
+async def _safe_target(_url: str, *, allow_private: bool = False) -> SimpleNamespace:
+    del allow_private
+    return SimpleNamespace(hostname="example.com", pinned_ip="93.184.216.34")
+
+
 async def test_verify_agent_json_extracts_inline_commitments_metadata(monkeypatch) -> None:
     def _handler(request: httpx.Request) -> httpx.Response:
         if request.url.path == "/.well-known/agent.json":
@@ -34,11 +39,8 @@ async def test_verify_agent_json_extracts_inline_commitments_metadata(monkeypatc
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -77,11 +79,8 @@ async def test_verify_agent_json_skips_inline_commitments_for_non_v14(monkeypatc
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -119,11 +118,8 @@ async def test_verify_agent_json_drops_metadata_when_domain_mismatch(monkeypatch
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -17,7 +17,7 @@ async def _noop_pin_hostname_resolution(_hostname: str, _pinned_ip: str):
     yield
 
 
-def _safe_target(url: str, *, allow_private: bool = False) -> SimpleNamespace:
+async def _safe_target(url: str, *, allow_private: bool = False) -> SimpleNamespace:
     del allow_private
     return SimpleNamespace(
         hostname=urlsplit(url).hostname or "agent.example",
@@ -73,7 +73,7 @@ async def test_verify_commitments_document_succeeds_for_valid_signed_payload(mon
             return httpx.Response(200, json=did_document, request=request)
         return httpx.Response(404, request=request)
 
-    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound", _safe_target)
+    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound_async", _safe_target)
     monkeypatch.setattr("agora.commitments.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
     async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
@@ -133,7 +133,7 @@ async def test_verify_commitments_document_returns_false_for_invalid_signature(m
             return httpx.Response(200, json=did_document, request=request)
         return httpx.Response(404, request=request)
 
-    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound", _safe_target)
+    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound_async", _safe_target)
     monkeypatch.setattr("agora.commitments.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
     async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
@@ -155,7 +155,7 @@ async def test_verify_commitments_document_requires_verified_did(monkeypatch) ->
         attempts.append(str(request.url))
         return httpx.Response(500, request=request)
 
-    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound", _safe_target)
+    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound_async", _safe_target)
     monkeypatch.setattr("agora.commitments.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
     async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
@@ -220,7 +220,7 @@ async def test_verify_commitments_document_handles_multicodec_prefixed_key(monke
             return httpx.Response(200, json=did_document, request=request)
         return httpx.Response(404, request=request)
 
-    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound", _safe_target)
+    monkeypatch.setattr("agora.commitments.assert_url_safe_for_outbound_async", _safe_target)
     monkeypatch.setattr("agora.commitments.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
     async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import httpx
 
 from agora.erc8004 import (
@@ -9,6 +11,11 @@ from agora.erc8004 import (
 )
 
 
+async def _safe_target(_url: str, *, allow_private: bool = False) -> SimpleNamespace:
+    del allow_private
+    return SimpleNamespace(hostname="example.com", pinned_ip="93.184.216.34")
+
+
 def test_build_registration_url_uses_endpoint_domain() -> None:
     assert (
         build_registration_url("https://example.com/agents/demo?x=1")
@@ -37,8 +44,8 @@ async def test_discover_erc8004_registration_econ_id_parses_first_valid_registra
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.erc8004.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: type("Target", (), {"hostname": "example.com", "pinned_ip": "93.184.216.34"})(),
+        "agora.erc8004.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
 
     # keep pinning simple for unit test
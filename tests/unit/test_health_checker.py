@@ -3,11 +3,14 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from types import SimpleNamespace
+from uuid import UUID
 
 import httpx
 
-from agora.health_checker import _check_single_agent, build_agent_card_probe_urls
+import agora.health_checker as health_checker_module
+from agora.health_checker import _check_single_agent, build_agent_card_probe_urls, run_health_check_cycle
 from agora.models import Agent
+from agora.query_tracker import QueryTracker
 
 
 def _valid_card(url: str, *, protocol_version: str = "0.3.0") -> dict[str, object]:
@@ -59,6 +62,11 @@ async def _noop_pin_hostname_resolution(_hostname: str, _pinned_ip: str):
     yield
 
 
+async def _safe_target(_url: str, *, allow_private: bool = False) -> SimpleNamespace:
+    del allow_private
+    return SimpleNamespace(hostname="example.com", pinned_ip="93.184.216.34")
+
+
 def test_build_agent_card_probe_urls_orders_and_dedupes() -> None:
     assert build_agent_card_probe_urls("https://example.com/agents/demo?x=1#section") == [
         "https://example.com/.well-known/agent-card.json",
@@ -83,11 +91,8 @@ async def test_check_single_agent_uses_fallback_when_well_known_fails(monkeypatc
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -126,11 +131,8 @@ async def test_check_single_agent_refreshes_protocol_version_from_fetched_card(m
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -158,11 +160,8 @@ async def test_check_single_agent_marks_unhealthy_when_all_probes_fail(monkeypat
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -215,11 +214,8 @@ async def test_check_single_agent_verifies_or_populates_econ_id_from_erc8004_reg
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -265,11 +261,8 @@ async def test_check_single_agent_recomputes_commitment_verification(monkeypatch
         return bool(kwargs["did_verified"]) and kwargs["did"] == "did:web:commitments.example"
 
     monkeypatch.setattr(
-        "agora.health_checker.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.health_checker.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.health_checker.pin_hostname_resolution", _noop_pin_hostname_resolution)
     monkeypatch.setattr("agora.health_checker.verify_commitments_document", _fake_verify_commitments_document)
@@ -317,11 +310,8 @@ async def test_check_single_agent_verifies_agent_json_manifest(monkeypatch) -> N
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -361,11 +351,8 @@ async def test_check_single_agent_fails_agent_json_domain_mismatch(monkeypatch)
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -411,11 +398,8 @@ async def test_check_single_agent_fails_agent_json_did_mismatch(monkeypatch) ->
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -443,11 +427,8 @@ async def test_check_single_agent_skips_when_agent_json_missing(monkeypatch) ->
         return httpx.Response(404, request=request)
 
     monkeypatch.setattr(
-        "agora.agent_json.assert_url_safe_for_outbound",
-        lambda _url, allow_private=False: SimpleNamespace(
-            hostname="example.com",
-            pinned_ip="93.184.216.34",
-        ),
+        "agora.agent_json.assert_url_safe_for_outbound_async",
+        _safe_target,
     )
     monkeypatch.setattr("agora.agent_json.pin_hostname_resolution", _noop_pin_hostname_resolution)
 
@@ -466,3 +447,43 @@ async def test_check_single_agent_skips_when_agent_json_missing(monkeypatch) ->
     assert agent.agent_json_verified is False
     assert agent.commitments_count is None
     assert agent.commitments_summary is None
+
+
+async def test_run_health_check_cycle_commits_when_one_agent_check_raises(monkeypatch) -> None:
+    agents = [_agent(f"https://agent-{index}.example.com/a2a") for index in range(3)]
+    for index, agent in enumerate(agents):
+        agent.id = UUID(int=index + 1)
+    tracker = QueryTracker()
+    for agent in agents:
+        tracker.mark(agent.id)
+
+    class _Session:
+        committed = False
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_exc_info):
+            return None
+
+        async def scalars(self, _statement):
+            return SimpleNamespace(all=lambda: agents)
+
+        async def commit(self) -> None:
+            self.committed = True
+
+    async def _check(agent: Agent, _client, now_utc: datetime, **_kwargs) -> bool:
+        if agent is agents[1]:
+            raise RuntimeError("unexpected probe failure")
+        agent.health_status = "healthy"
+        agent.last_health_check = now_utc
+        return True
+
+    monkeypatch.setattr(health_checker_module, "_check_single_agent", _check)
+    session = _Session()
+
+    summary = await run_health_check_cycle(lambda: session, tracker)
+
+    assert session.committed
+    assert (summary.checked_count, summary.healthy_count, summary.unhealthy_count) == (3, 2, 1)
+    assert [agent.health_status for agent in agents] == ["healthy", "unknown", "healthy"]
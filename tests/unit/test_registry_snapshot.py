@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import asyncio
+
+import agora.main as main_module
+
+
+async def test_concurrent_snapshot_refreshes_share_one_build(monkeypatch) -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def _fake_build(_session_factory: object) -> dict[str, object]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"generated_at": "2026-01-01T00:00:00+00:00", "agents_count": 0, "agents": []}
+
+    monkeypatch.setattr(main_module, "build_registry_snapshot", _fake_build)
+    monkeypatch.setattr(main_module, "latest_registry_snapshot", None)
+    monkeypatch.setattr(main_module, "registry_snapshot_build", None)
+
+    waiters = [asyncio.create_task(main_module._refresh_registry_snapshot()) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    snapshots = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert main_module.latest_registry_snapshot is snapshots[0]
@@ -0,0 +1,29 @@
+from agora.sanitization import sanitize_json_strings, sanitize_ui_text
+
+
+def test_sanitize_ui_text_strips_control_characters_and_caps_length() -> None:
+    assert sanitize_ui_text(None) == ""
+    assert sanitize_ui_text("a\x00b\x1fc\x7f") == "abc\x7f"
+    assert sanitize_ui_text("line\nnext\r\n\tindented") == "line\nnext\r\n\tindented"
+    assert sanitize_ui_text("abcdef", max_length=3) == "abc"
+
+
+def test_sanitize_json_strings_cleans_nested_values() -> None:
+    payload = {"name": "ok\x00", "skills": [{"id": "a\x07"}, 3, None], "flag": True}
+    assert sanitize_json_strings(payload) == {
+        "name": "ok",
+        "skills": [{"id": "a"}, 3, None],
+        "flag": True,
+    }
+
+
+def test_sanitize_json_strings_returns_clean_payload_unchanged() -> None:
+    payload = {"name": "clean", "skills": [{"id": "a", "tags": ["x"]}]}
+    assert sanitize_json_strings(payload) is payload
+
+    dirty = {"clean": {"nested": ["ok"]}, "dirty": ["bad\x00"]}
+    result = sanitize_json_strings(dirty)
+    assert result == {"clean": {"nested": ["ok"]}, "dirty": ["bad"]}
+    assert result is not dirty
+    assert result["clean"] is dirty["clean"]
+    assert dirty["dirty"] == ["bad\x00"]
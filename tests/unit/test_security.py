@@ -1,7 +1,11 @@
 from hashlib import sha256
 
+import agora.security as security_module
 from agora.security import (
+    api_key_fingerprint,
+    benchmark_argon2,
     hash_api_key,
+    invalidate_api_key_cache,
     is_legacy_api_key_hash,
     should_rehash_api_key_hash,
     verify_api_key,
@@ -23,3 +27,45 @@ def test_legacy_sha256_hashes_still_verify_and_upgrade() -> None:
     assert verify_api_key("legacy-key", legacy_digest) is True
     assert verify_api_key("wrong-key", legacy_digest) is False
     assert should_rehash_api_key_hash(legacy_digest) is True
+
+
+def test_successful_argon2_verification_is_cached(monkeypatch) -> None:
+    invalidate_api_key_cache()
+    digest = hash_api_key("cached-key")
+    real_hasher = security_module._api_key_hasher()
+    verify_calls = 0
+
+    class _CountingHasher:
+        def verify(self, stored_hash: str, api_key: str) -> bool:
+            nonlocal verify_calls
+            verify_calls += 1
+            return real_hasher.verify(stored_hash, api_key)
+
+    monkeypatch.setattr(security_module, "_API_KEY_HASHER", _CountingHasher())
+
+    assert verify_api_key("cached-key", digest) is True
+    assert verify_api_key("cached-key", digest) is True
+    assert verify_calls == 1
+
+    assert verify_api_key("wrong-key", digest) is False
+    assert verify_calls == 2
+
+    invalidate_api_key_cache(api_key_fingerprint("cached-key"))
+    assert verify_api_key("cached-key", digest) is True
+    assert verify_calls == 3
+
+
+def test_benchmark_argon2_returns_bounded_time_cost() -> None:
+    assert benchmark_argon2(memory_cost=8, target_min_ms=0.0, max_time_cost=4) == 1
+    assert benchmark_argon2(memory_cost=8, target_min_ms=float("inf"), max_time_cost=4) == 4
+
+
+def test_malformed_stored_hash_is_rejected_without_argon2(monkeypatch) -> None:
+    class _UnusedHasher:
+        def verify(self, *_args: object) -> bool:
+            raise AssertionError("Argon2 verify should not run for malformed hashes")
+
+    monkeypatch.setattr(security_module, "_API_KEY_HASHER", _UnusedHasher())
+    assert verify_api_key("test-key", "") is False
+    assert verify_api_key("test-key", "not-a-hash") is False
+    assert verify_api_key("test-key", "$argon2id$" + "x" * 300) is False
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 
-from agora.stale import compute_stale_metadata
+from agora.stale import compute_stale_metadata, compute_stale_metadata_bulk
 
 
 def test_stale_matrix() -> None:
@@ -44,3 +44,26 @@ def test_stale_matrix() -> None:
         registered_at=now - timedelta(days=9),
         now=now,
     ) == (False, 0)
+
+
+def test_bulk_stale_metadata_matches_per_row_computation() -> None:
+    now = datetime.now(tz=timezone.utc)
+    rows = [
+        ("unknown", None, now - timedelta(days=30)),
+        ("healthy", now - timedelta(days=10), now - timedelta(days=30)),
+        ("unhealthy", now - timedelta(days=8), now - timedelta(days=30)),
+        ("unhealthy", None, now - timedelta(days=9)),
+        ("unhealthy", now - timedelta(days=2), now - timedelta(days=9)),
+        ("unhealthy", None, now - timedelta(days=7)),
+    ]
+
+    expected = [
+        compute_stale_metadata(
+            health_status=health_status,
+            last_healthy_at=last_healthy_at,
+            registered_at=registered_at,
+            now=now,
+        )
+        for health_status, last_healthy_at, registered_at in rows
+    ]
+    assert compute_stale_metadata_bulk(rows, now=now) == expected
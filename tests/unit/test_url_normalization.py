@@ -23,3 +23,27 @@ def test_normalize_url_rejects_userinfo() -> None:
         assert "userinfo" in str(exc)
         return
     assert False, "Expected URLNormalizationError for URLs with userinfo"
+
+
+def test_normalize_url_handles_empty_query_and_ipv6_hosts() -> None:
+    assert normalize_url("https://agent.example.com?") == "https://agent.example.com/"
+    assert normalize_url("https://[2001:db8::1]:8443/a2a//") == "https://[2001:db8::1]:8443/a2a"
+
+
+def test_normalize_url_returns_canonical_urls_unchanged() -> None:
+    for url in (
+        "https://agent.example.com/a2a",
+        "http://example.com/",
+        "https://agent.example.com:8443/a2a?x=1",
+        "https://agent.example.com/a//b",
+    ):
+        assert normalize_url(url) == url
+        assert normalize_url(normalize_url(url)) == url
+
+    assert normalize_url("https://agent.example.com:0443/a2a") == "https://agent.example.com/a2a"
+    try:
+        normalize_url("https://agent.example.com:70000/a2a")
+    except URLNormalizationError as exc:
+        assert "port" in str(exc)
+        return
+    assert False, "Expected URLNormalizationError for out-of-range port"
@@ -2,10 +2,13 @@ import socket
 import asyncio
 import ipaddress
 
+import agora.url_safety as url_safety_module
 from agora.url_safety import (
     URLSafetyError,
     assert_url_safe_for_outbound,
+    assert_url_safe_for_outbound_async,
     assert_url_safe_for_registration,
+    invalidate_outbound_target,
     pin_hostname_resolution,
 )
 
@@ -44,7 +47,7 @@ def test_outbound_resolution_returns_pinned_target(monkeypatch) -> None:
     assert str(target.pinned_ip) == "93.184.216.34"
 
 
-def test_pin_hostname_resolution_overrides_runtime_dns(monkeypatch) -> None:
+async def test_pin_hostname_resolution_overrides_runtime_dns(monkeypatch) -> None:
     original = socket.getaddrinfo
 
     def _dynamic(host: object, port: object, *args: object, **kwargs: object):
@@ -55,12 +58,129 @@ def test_pin_hostname_resolution_overrides_runtime_dns(monkeypatch) -> None:
 
     monkeypatch.setattr(socket, "getaddrinfo", _dynamic)
 
-    async def _run() -> None:
-        async with pin_hostname_resolution("rebind.example.test", "93.184.216.34"):
-            pinned_records = socket.getaddrinfo("rebind.example.test", 443, type=socket.SOCK_STREAM)
-            assert pinned_records[0][4][0] == "93.184.216.34"
+    async with pin_hostname_resolution("rebind.example.test", "93.184.216.34"):
+        pinned_records = socket.getaddrinfo("rebind.example.test", 443, type=socket.SOCK_STREAM)
+        assert pinned_records[0][4][0] == "93.184.216.34"
 
-        rebound_records = socket.getaddrinfo("rebind.example.test", 443, type=socket.SOCK_STREAM)
-        assert rebound_records[0][4][0] == "127.0.0.1"
+    rebound_records = socket.getaddrinfo("rebind.example.test", 443, type=socket.SOCK_STREAM)
+    assert rebound_records[0][4][0] == "127.0.0.1"
 
-    asyncio.run(_run())
+
+async def test_resolved_ips_are_cached_per_hostname(monkeypatch) -> None:
+    lookups: list[str] = []
+
+    def _lookup(hostname: str) -> list[ipaddress.IPv4Address]:
+        lookups.append(hostname)
+        return [ipaddress.ip_address("93.184.216.34")]
+
+    monkeypatch.setattr("agora.url_safety._lookup_ips", _lookup)
+    url_safety_module._resolved_ips_cache.clear()
+
+    first = assert_url_safe_for_outbound("https://cached.example.test/a")
+    second = assert_url_safe_for_outbound("https://CACHED.example.test/b")
+    third = await assert_url_safe_for_outbound_async("https://cached.example.test/c")
+
+    assert first.pinned_ip == second.pinned_ip == third.pinned_ip
+    assert lookups == ["cached.example.test"]
+    url_safety_module._resolved_ips_cache.clear()
+
+
+async def test_async_outbound_check_rejects_private_resolution(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "agora.url_safety._resolve_ips",
+        lambda _hostname: [ipaddress.ip_address("10.0.0.8")],
+    )
+    url_safety_module._resolved_ips_cache.clear()
+    try:
+        await assert_url_safe_for_outbound_async("https://internal.example.test/")
+    except URLSafetyError as exc:
+        assert "private" in str(exc).lower()
+        return
+    assert False, "Expected URLSafetyError for private resolution"
+
+
+def test_blocked_ip_ranges_match_stdlib_classification() -> None:
+    def _stdlib_blocked(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+        return bool(
+            ip.is_private
+            or ip.is_loopback
+            or ip.is_link_local
+            or ip.is_multicast
+            or ip.is_reserved
+            or ip.is_unspecified
+        )
+
+    samples = [
+        "0.0.0.0",
+        "8.8.8.8",
+        "10.255.255.255",
+        "93.184.216.34",
+        "127.0.0.1",
+        "169.254.169.254",
+        "172.15.255.255",
+        "172.16.0.1",
+        "192.168.1.1",
+        "224.0.0.1",
+        "255.255.255.255",
+        "::",
+        "::1",
+        "::ffff:10.0.0.1",
+        "2001:db8::1",
+        "2606:4700:4700::1111",
+        "fc00::1",
+        "fe80::1",
+        "ff02::1",
+    ]
+    for raw in samples:
+        ip = ipaddress.ip_address(raw)
+        assert url_safety_module._is_blocked_ip(ip) is _stdlib_blocked(ip), raw
+
+    # Python 3.12.4+ widened is_private to nearly all of 192.0.0.0/24 while older
+    # versions only cover parts of it; the table blocks the whole block on every version.
+    for raw in ("192.0.0.0", "192.0.0.8", "192.0.0.9", "192.0.0.21", "192.0.0.171", "192.0.0.255"):
+        assert url_safety_module._is_blocked_ip(ipaddress.ip_address(raw)), raw
+    assert not url_safety_module._is_blocked_ip(ipaddress.ip_address("192.0.1.1"))
+
+
+async def test_pin_hostname_resolution_allows_concurrent_pins(monkeypatch) -> None:
+    monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)
+
+    async def _resolve_inside_pin(
+        hostname: str,
+        pinned_ip: str,
+        entered: asyncio.Event,
+        release: asyncio.Event,
+    ) -> str:
+        async with pin_hostname_resolution(hostname, pinned_ip):
+            entered.set()
+            await release.wait()
+            records = socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+            return records[0][4][0]
+
+    first_entered, second_entered, release = asyncio.Event(), asyncio.Event(), asyncio.Event()
+    first = asyncio.create_task(_resolve_inside_pin("a.example.test", "93.184.216.34", first_entered, release))
+    second = asyncio.create_task(_resolve_inside_pin("b.example.test", "93.184.216.35", second_entered, release))
+    await asyncio.wait_for(asyncio.gather(first_entered.wait(), second_entered.wait()), timeout=1)
+    release.set()
+    assert await first == "93.184.216.34"
+    assert await second == "93.184.216.35"
+    assert url_safety_module._pinned_hosts == {}
+
+
+def test_invalidate_outbound_target_forces_re_resolution(monkeypatch) -> None:
+    lookups: list[str] = []
+
+    def _lookup(hostname: str) -> list[ipaddress.IPv4Address]:
+        lookups.append(hostname)
+        return [ipaddress.ip_address("93.184.216.34")]
+
+    monkeypatch.setattr("agora.url_safety._lookup_ips", _lookup)
+    url_safety_module._resolved_ips_cache.clear()
+
+    assert_url_safe_for_outbound("https://flaky.example.test/a")
+    assert_url_safe_for_outbound("https://flaky.example.test/b")
+    invalidate_outbound_target("https://flaky.example.test/c")
+    assert_url_safe_for_outbound("https://flaky.example.test/d")
+
+    assert lookups == ["flaky.example.test", "flaky.example.test"]
+    url_safety_module._resolved_ips_cache.clear()
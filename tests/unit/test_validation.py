@@ -1,4 +1,6 @@
-from agora.validation import AgentCardValidationError, validate_agent_card
+import json
+
+from agora.validation import AgentCardValidationError, validate_agent_card, validate_agent_card_json
 
 
 def _valid_payload() -> dict:
@@ -83,3 +85,70 @@ def test_validate_agent_card_rejects_oversized_name() -> None:
         assert any(error["field"] == "name" for error in exc.errors)
         return
     assert False, "Expected AgentCardValidationError for oversized name"
+
+
+def test_validate_agent_card_json_matches_dict_validation() -> None:
+    payload = _valid_payload()
+    from_json = validate_agent_card_json(json.dumps(payload).encode("utf-8"))
+    from_dict = validate_agent_card(payload)
+    assert from_json.card == from_dict.card
+    assert from_json.skills == from_dict.skills
+    assert from_json.input_modes == from_dict.input_modes
+
+
+def test_validate_agent_card_json_rejects_malformed_json() -> None:
+    try:
+        validate_agent_card_json(b"{not json")
+    except AgentCardValidationError as exc:
+        assert exc.errors
+        return
+    assert False, "Expected AgentCardValidationError for malformed JSON"
+
+
+def test_validate_agent_card_normalizes_url_and_rejects_bad_scheme() -> None:
+    payload = _valid_payload()
+    payload["url"] = "HTTPS://Validation.Example.com:443/a2a/"
+    assert validate_agent_card(payload).card.url == "https://validation.example.com/a2a"
+
+    payload["url"] = "ftp://validation.example.com/a2a"
+    try:
+        validate_agent_card(payload)
+    except AgentCardValidationError as exc:
+        assert any(error["field"] == "url" for error in exc.errors)
+        return
+    assert False, "Expected AgentCardValidationError for non-http URL"
+
+
+def test_validate_agent_card_rejects_too_many_skills() -> None:
+    payload = _valid_payload()
+    payload["skills"] = [{"id": f"skill-{index}", "name": f"Skill {index}"} for index in range(257)]
+
+    try:
+        validate_agent_card(payload)
+    except AgentCardValidationError as exc:
+        assert any(error["field"] == "skills" for error in exc.errors)
+        return
+    assert False, "Expected AgentCardValidationError for too many skills"
+
+
+def test_validate_agent_card_encodes_idn_hosts_and_non_ascii_paths() -> None:
+    payload = _valid_payload()
+    payload["url"] = "https://Bücher.example/café/"
+    unicode_card = validate_agent_card(payload).card
+    assert unicode_card.url == "https://xn--bcher-kva.example/caf%C3%A9"
+
+    payload["url"] = "https://xn--bcher-kva.example/caf%C3%A9"
+    assert validate_agent_card(payload).card.url == unicode_card.url
+    assert unicode_card.model_dump(by_alias=True, mode="json")["url"] == unicode_card.url
+
+
+def test_validate_agent_card_rejects_invalid_host_characters() -> None:
+    for url in ("https://a_b!$.com/x", "https://exa<mple.com/a2a", "https://validation.example.com/a 2a"):
+        payload = _valid_payload()
+        payload["url"] = url
+        try:
+            validate_agent_card(payload)
+        except AgentCardValidationError as exc:
+            assert any(error["field"] == "url" for error in exc.errors), url
+            continue
+        assert False, f"Expected AgentCardValidationError for {url!r}"